@@ -1,78 +1,167 @@
 import os
-from dotenv import load_dotenv
-from typing import List
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from dotenv import dotenv_values, find_dotenv
+from typing import ClassVar, Optional, Tuple
 
-load_dotenv()
+def _load_env_cached(path: str = "") -> None:
+    """Load .env into os.environ, reusing a pickled parse while the file is unchanged"""
+    # Like load_dotenv(), search upward from this package rather than the working directory
+    path = path or find_dotenv()
+    if not path:
+        return
+    
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return
+    
+    key = (st.st_mtime_ns, st.st_size)
+    cache = Path(path).with_name(".env.cache.pkl")
+    
+    pairs = None
+    try:
+        cached_key, cached_pairs = pickle.loads(cache.read_bytes())
+        if cached_key == key:
+            pairs = cached_pairs
+    except Exception:
+        pass
+    
+    if pairs is None:
+        pairs = dotenv_values(path)
+        try:
+            cache.write_bytes(pickle.dumps((key, pairs)))
+        except OSError:
+            pass
+    
+    # Like load_dotenv(), never override variables already set in the environment
+    for name, value in pairs.items():
+        if value is not None:
+            os.environ.setdefault(name, value)
+
+_load_env_cached()
 
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Application settings"""
-    
+    """Application settings, snapshotted from the environment once at import"""
+
     # API Configuration
-    API_TITLE = "Auto Job Application System"
-    API_VERSION = "1.0.0"
-    HOST = os.getenv("HOST", "0.0.0.0")
-    PORT = int(os.getenv("PORT", 8000))
-    DEBUG = os.getenv("DEBUG", "False").lower() == "true"
-    
+    API_TITLE: ClassVar[str] = "Auto Job Application System"
+    API_VERSION: ClassVar[str] = "1.0.0"
+    HOST: str
+    PORT: int
+    DEBUG: bool
+    WEB_CONCURRENCY: int
+    CORS_ORIGINS: Tuple[str, ...]
+
     # Groq Configuration
-    GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-    GROQ_MODEL = os.getenv("GROQ_MODEL", "llama3-8b-8192")
-    
+    GROQ_API_KEY: Optional[str]
+    GROQ_MODEL: str
+    GROQ_MAX_RPM: int
+    MAX_CONCURRENT_LLM: int
+
     # Email Configuration
-    SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
-    SMTP_PORT = int(os.getenv("SMTP_PORT", 587))
-    SMTP_USERNAME = os.getenv("SMTP_USERNAME")
-    SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")
-    EMAIL_FROM = os.getenv("EMAIL_FROM")
-    
+    SMTP_SERVER: str
+    SMTP_PORT: int
+    SMTP_USERNAME: Optional[str]
+    SMTP_PASSWORD: Optional[str]
+    EMAIL_FROM: Optional[str]
+    SMTP_POOL_SIZE: int
+    SMTP_MAX_PER_MINUTE: int
+
     # Job Sites Configuration
-    SUPPORTED_JOB_SITES = [
+    SUPPORTED_JOB_SITES: ClassVar[Tuple[str, ...]] = (
         "indeed",
-        "linkedin", 
+        "linkedin",
         "glassdoor",
         "monster",
         "ziprecruiter"
-    ]
-    
+    )
+
     # Scraping Configuration
-    SCRAPING_DELAY = float(os.getenv("SCRAPING_DELAY", 2.0))
-    MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
-    USER_AGENT = os.getenv("USER_AGENT", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-    
+    SCRAPING_DELAY: float
+    MAX_RETRIES: int
+    SCRAPING_MAX_RPM: int
+    USER_AGENT: str
+    CHROMEDRIVER_PATH: Optional[str]
+    SEEN_JOBS_DB: str
+    SEEN_JOBS_TTL_DAYS: int
+
     # CrewAI Configuration
-    CREW_MAX_RPM = int(os.getenv("CREW_MAX_RPM", 10))
-    CREW_VERBOSE = os.getenv("CREW_VERBOSE", "True").lower() == "true"
-    
+    CREW_MAX_RPM: int
+    CREW_VERBOSE: bool
+
     # Database Configuration (for future use)
-    DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./job_applications.db")
+    DATABASE_URL: str
     
+    # Task Queue Configuration
+    REDIS_URL: str
+
     # Logging Configuration
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-    LOG_FILE = os.getenv("LOG_FILE", "app.log")
-    
+    LOG_LEVEL: str
+    LOG_FILE: str
+
     # Security Configuration
-    SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here")
-    ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
-    
+    SECRET_KEY: str
+    ACCESS_TOKEN_EXPIRE_MINUTES: int
+
     @classmethod
-    def validate_settings(cls):
+    def _load(cls) -> "Settings":
+        """Read and coerce every environment variable exactly once"""
+        env = os.environ.get
+        return cls(
+            HOST=env("HOST", "0.0.0.0"),
+            PORT=int(env("PORT", 8000)),
+            DEBUG=env("DEBUG", "False").lower() == "true",
+            WEB_CONCURRENCY=int(env("WEB_CONCURRENCY", os.cpu_count() or 2)),
+            CORS_ORIGINS=tuple(origin.strip() for origin in env("CORS_ORIGINS", "").split(",") if origin.strip()),
+            GROQ_API_KEY=env("GROQ_API_KEY"),
+            GROQ_MODEL=env("GROQ_MODEL", "llama3-8b-8192"),
+            GROQ_MAX_RPM=int(env("GROQ_MAX_RPM", 30)),
+            MAX_CONCURRENT_LLM=int(env("MAX_CONCURRENT_LLM", 8)),
+            SMTP_SERVER=env("SMTP_SERVER", "smtp.gmail.com"),
+            SMTP_PORT=int(env("SMTP_PORT", 587)),
+            SMTP_USERNAME=env("SMTP_USERNAME"),
+            SMTP_PASSWORD=env("SMTP_PASSWORD"),
+            EMAIL_FROM=env("EMAIL_FROM"),
+            SMTP_POOL_SIZE=int(env("SMTP_POOL_SIZE", 4)),
+            SMTP_MAX_PER_MINUTE=int(env("SMTP_MAX_PER_MINUTE", 30)),
+            SCRAPING_DELAY=float(env("SCRAPING_DELAY", 2.0)),
+            MAX_RETRIES=int(env("MAX_RETRIES", 3)),
+            SCRAPING_MAX_RPM=int(env("SCRAPING_MAX_RPM", 30)),
+            USER_AGENT=env("USER_AGENT", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"),
+            CHROMEDRIVER_PATH=env("CHROMEDRIVER_PATH"),
+            SEEN_JOBS_DB=env("SEEN_JOBS_DB", "~/.cache/auto-mail-sender/seen.db"),
+            SEEN_JOBS_TTL_DAYS=int(env("SEEN_JOBS_TTL_DAYS", 30)),
+            CREW_MAX_RPM=int(env("CREW_MAX_RPM", 10)),
+            CREW_VERBOSE=env("CREW_VERBOSE", "False").lower() == "true",
+            DATABASE_URL=env("DATABASE_URL", "sqlite:///./job_applications.db"),
+            REDIS_URL=env("REDIS_URL", "redis://localhost:6379"),
+            LOG_LEVEL=env("LOG_LEVEL", "INFO"),
+            LOG_FILE=env("LOG_FILE", "app.log"),
+            SECRET_KEY=env("SECRET_KEY", "your-secret-key-here"),
+            ACCESS_TOKEN_EXPIRE_MINUTES=int(env("ACCESS_TOKEN_EXPIRE_MINUTES", 30)),
+        )
+
+    def validate_settings(self):
         """Validate required settings"""
         required_settings = [
-            ("GROQ_API_KEY", cls.GROQ_API_KEY),
-            ("SMTP_USERNAME", cls.SMTP_USERNAME),
-            ("SMTP_PASSWORD", cls.SMTP_PASSWORD),
-            ("EMAIL_FROM", cls.EMAIL_FROM),
+            ("GROQ_API_KEY", self.GROQ_API_KEY),
+            ("SMTP_USERNAME", self.SMTP_USERNAME),
+            ("SMTP_PASSWORD", self.SMTP_PASSWORD),
+            ("EMAIL_FROM", self.EMAIL_FROM),
         ]
-        
+
         missing_settings = []
         for name, value in required_settings:
             if not value:
                 missing_settings.append(name)
-        
+
         if missing_settings:
             raise ValueError(f"Missing required environment variables: {', '.join(missing_settings)}")
-        
+
         return True
 
 # Global settings instance
-settings = Settings() 
\ No newline at end of file
+settings = Settings._load()
\ No newline at end of file
@@ -1,44 +1,67 @@
 import asyncio
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from functools import lru_cache
+from arq import create_pool
+from arq.connections import RedisSettings
+from arq.jobs import Job, JobStatus
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from config.settings import settings
-from models.schemas import JobApplicationRequest, UserProfile, JobPosting
+from models.schemas import (
+    JobApplicationRequest,
+    UserProfile,
+    EmailRequest,
+    SendEmailRequest,
+    ProcessApplicationRequest,
+    ScrapeJobsResponse,
+    ApplicationStatus,
+)
 from services.crew_manager import CrewManager
 from services.job_scraper import JobScraper
 from services.email_generator import EmailGenerator
 from services.email_sender import EmailSender
+from services.http_client import SHARED_HTTPX
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO,
+    level=settings.LOG_LEVEL.upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
 # Global variables for services
-crew_manager = None
 job_scraper = None
 email_generator = None
 email_sender = None
 
+@lru_cache(maxsize=None)
+def get_crew_manager() -> CrewManager:
+    """Build the CrewAI manager on first use so startup skips the crewai import"""
+    return CrewManager(
+        job_scraper=job_scraper,
+        email_generator=email_generator,
+        email_sender=email_sender
+    )
+
 @asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan manager"""
-    global crew_manager, job_scraper, email_generator, email_sender
-    
-    # Startup
-    logger.info("Starting Auto Mail Sender application...")
+async def services_lifespan(app: FastAPI):
+    """Initialize the shared services concurrently"""
+    global job_scraper, email_generator, email_sender
     
     try:
-        # Initialize services
-        crew_manager = CrewManager()
-        job_scraper = JobScraper()
-        email_generator = EmailGenerator()
-        email_sender = EmailSender()
+        # Constructors do blocking client setup, so run them side by side
+        # in threads (the crew manager is built lazily)
+        job_scraper, email_generator, email_sender = await asyncio.gather(
+            asyncio.to_thread(JobScraper),
+            asyncio.to_thread(EmailGenerator),
+            asyncio.to_thread(EmailSender)
+        )
         
         logger.info("All services initialized successfully")
         
@@ -46,7 +69,37 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize services: {e}")
         raise
     
-    yield
+    # One scraper serves every request, so its session and browsers start and stop once
+    async with job_scraper:
+        try:
+            yield
+        finally:
+            await email_sender.aclose()
+            await SHARED_HTTPX.aclose()
+
+@asynccontextmanager
+async def queue_lifespan(app: FastAPI):
+    """Connect to the arq task queue used for application pipelines"""
+    app.state.arq = await create_pool(RedisSettings.from_dsn(settings.REDIS_URL))
+    
+    try:
+        yield
+    finally:
+        await app.state.arq.close()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan manager, composing the sub-lifespans below"""
+    # Startup
+    logger.info("Starting Auto Mail Sender application...")
+    
+    # Sized for to_thread offloads (service construction, prompt rendering in large bulk runs)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+    )
+    
+    async with services_lifespan(app), queue_lifespan(app):
+        yield
     
     # Shutdown
     logger.info("Shutting down Auto Mail Sender application...")
@@ -56,18 +109,23 @@ app = FastAPI(
     title="Auto Mail Sender",
     description="Automated job application system using CrewAI and Groq",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=list(settings.CORS_ORIGINS),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
+    max_age=86400,
 )
 
+# Compress large JSON payloads such as scraped job lists
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -83,43 +141,40 @@ async def health_check():
     return {
         "status": "healthy",
         "services": {
-            "crew_manager": crew_manager is not None,
+            "crew_manager": get_crew_manager.cache_info().currsize > 0,
             "job_scraper": job_scraper is not None,
             "email_generator": email_generator is not None,
             "email_sender": email_sender is not None
         }
     }
 
-@app.post("/api/jobs/scrape")
+@app.post("/api/jobs/scrape", response_model=ScrapeJobsResponse)
 async def scrape_jobs(request: JobApplicationRequest):
     """Scrape jobs based on keywords and location"""
     try:
         logger.info(f"Scraping jobs for keywords: {request.keywords}")
         
-        jobs = await job_scraper.scrape_jobs(
+        jobs = [job async for job in job_scraper.scrape_jobs(
             keywords=request.keywords,
             location=request.location,
             max_jobs=request.max_jobs
-        )
+        )]
         
-        return {
-            "success": True,
-            "jobs_found": len(jobs),
-            "jobs": [job.dict() for job in jobs]
-        }
+        return ScrapeJobsResponse(success=True, jobs_found=len(jobs), jobs=jobs)
         
     except Exception as e:
         logger.error(f"Error scraping jobs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/email/generate")
-async def generate_email(request: dict):
+async def generate_email(request: EmailRequest):
     """Generate personalized email for job application"""
     try:
-        job_posting = JobPosting(**request["job_posting"])
-        user_profile = UserProfile(**request["user_profile"])
-        
-        email_content = await email_generator.generate_email(job_posting, user_profile)
+        email_content = await email_generator.generate_email(
+            request.job_posting,
+            request.user_profile,
+            email_type=request.email_type
+        )
         
         return {
             "success": True,
@@ -130,15 +185,30 @@ async def generate_email(request: dict):
         logger.error(f"Error generating email: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/email/stream")
+async def stream_email(request: EmailRequest):
+    """Stream the generated email body as plain text while Groq produces it"""
+    return StreamingResponse(
+        email_generator.generate_email_stream(
+            request.job_posting,
+            request.user_profile,
+            email_type=request.email_type
+        ),
+        media_type="text/plain; charset=utf-8",
+        # Declaring an encoding makes GZipMiddleware pass chunks through instead of
+        # buffering them inside its compressor until the stream ends
+        headers={"Content-Encoding": "identity"}
+    )
+
 @app.post("/api/email/send")
-async def send_email(request: dict):
+async def send_email(request: SendEmailRequest):
     """Send email for job application"""
     try:
-        job_posting = JobPosting(**request["job_posting"])
-        user_profile = UserProfile(**request["user_profile"])
-        email_content = request["email_content"]
-        
-        result = await email_sender.send_email(job_posting, user_profile, email_content)
+        result = await email_sender.send_job_application_email(
+            request.job_posting.model_dump(),
+            request.user_profile.model_dump(),
+            request.email_content
+        )
         
         return {
             "success": True,
@@ -150,13 +220,10 @@ async def send_email(request: dict):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/application/process")
-async def process_application(request: dict):
+async def process_application(request: ProcessApplicationRequest):
     """Process a single job application using CrewAI"""
     try:
-        job_posting = JobPosting(**request["job_posting"])
-        user_profile = UserProfile(**request["user_profile"])
-        
-        result = await crew_manager.process_job_application(job_posting, user_profile)
+        result = await get_crew_manager().process_job_application(request.job_posting, request.user_profile)
         
         return result
         
@@ -165,8 +232,8 @@ async def process_application(request: dict):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/application/pipeline")
-async def run_application_pipeline(request: JobApplicationRequest, background_tasks: BackgroundTasks):
-    """Run complete job application pipeline"""
+async def run_application_pipeline(request: JobApplicationRequest, http_request: Request):
+    """Queue a complete job application pipeline for the arq worker"""
     try:
         logger.info(f"Starting application pipeline for keywords: {request.keywords}")
         
@@ -179,18 +246,18 @@ async def run_application_pipeline(request: JobApplicationRequest, background_ta
             education=request.education
         )
         
-        # Run pipeline in background
-        background_tasks.add_task(
-            crew_manager.create_application_pipeline,
+        job = await http_request.app.state.arq.enqueue_job(
+            "pipeline_job",
             request.keywords,
             request.location,
-            user_profile,
+            user_profile.model_dump(),
             request.max_jobs
         )
         
         return {
             "success": True,
-            "message": "Application pipeline started in background",
+            "message": "Application pipeline queued",
+            "request_id": job.job_id,
             "keywords": request.keywords,
             "location": request.location,
             "max_jobs": request.max_jobs
@@ -200,14 +267,46 @@ async def run_application_pipeline(request: JobApplicationRequest, background_ta
         logger.error(f"Error starting application pipeline: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/application/status/{request_id}", response_model=ApplicationStatus)
+async def get_application_status(request_id: str, http_request: Request):
+    """Get the status of a queued application pipeline"""
+    job = Job(request_id, http_request.app.state.arq)
+    status = await job.status()
+    
+    if status == JobStatus.not_found:
+        raise HTTPException(status_code=404, detail="Application pipeline not found")
+    
+    info = await job.result_info() if status == JobStatus.complete else await job.info()
+    
+    if info is None:
+        raise HTTPException(status_code=404, detail="Application pipeline not found")
+    
+    if status != JobStatus.complete:
+        return ApplicationStatus(
+            request_id=request_id,
+            status=status.value,
+            start_time=info.enqueue_time
+        )
+    
+    # A failed job stores the raised exception as its result
+    result = info.result if info.success else {"error": str(info.result)}
+    
+    return ApplicationStatus(
+        request_id=request_id,
+        status=status.value,
+        jobs_processed=result.get("jobs_processed", 0),
+        emails_sent=result.get("applications_sent", 0),
+        errors=result.get("failed_applications", 0 if info.success else 1),
+        start_time=info.start_time,
+        end_time=info.finish_time,
+        details=result
+    )
+
 @app.get("/api/crew/status")
 async def get_crew_status():
     """Get status of CrewAI agents"""
     try:
-        if not crew_manager:
-            raise HTTPException(status_code=503, detail="Crew manager not initialized")
-        
-        status = crew_manager.get_agent_status()
+        status = get_crew_manager().get_agent_status()
         
         return {
             "success": True,
@@ -231,10 +330,15 @@ async def get_config():
 if __name__ == "__main__":
     import uvicorn
     
+    # Each worker is its own process with its own service singletons and LLM client;
+    # reload mode only supports a single worker
     uvicorn.run(
         "main:app",
         host=settings.HOST,
         port=settings.PORT,
+        loop="uvloop",
+        http="httptools",
+        workers=1 if settings.DEBUG else settings.WEB_CONCURRENCY,
         reload=settings.DEBUG,
         log_level="info"
     )
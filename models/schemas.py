@@ -1,9 +1,12 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+from functools import cached_property
 
 class UserProfile(BaseModel):
     """User profile information for job applications"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     name: str = Field(..., description="Full name of the applicant")
     email: str = Field(..., description="Email address")
     phone: Optional[str] = Field(None, description="Phone number")
@@ -18,20 +21,34 @@ class UserProfile(BaseModel):
 
 class JobPosting(BaseModel):
     """Job posting information"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     title: str = Field(..., description="Job title")
     company: str = Field(..., description="Company name")
     location: str = Field(..., description="Job location")
     description: str = Field(..., description="Job description")
-    requirements: List[str] = Field(default=[], description="Job requirements")
+    requirements: List[str] = Field(default_factory=list, description="Job requirements")
     salary_range: Optional[str] = Field(None, description="Salary range")
     job_url: str = Field(..., description="URL to the job posting")
     hiring_manager_email: Optional[str] = Field(None, description="Hiring manager email")
     application_deadline: Optional[datetime] = Field(None, description="Application deadline")
     job_type: Optional[str] = Field(None, description="Job type (full-time, part-time, etc.)")
     remote_option: Optional[bool] = Field(None, description="Remote work option available")
+    
+    @cached_property
+    def prompt_snippet(self) -> str:
+        """Job summary embedded in analysis prompts, built once per posting"""
+        # Stored in __dict__, which model equality ignores from pydantic 2.6 on
+        return (
+            f"{self.title} at {self.company}\n"
+            f"Job Requirements: {', '.join(self.requirements)}\n"
+            f"Job Description: {self.description[:500]}"
+        )
 
 class JobApplicationRequest(BaseModel):
     """Request model for job application process"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     keywords: List[str] = Field(..., description="Job search keywords")
     location: str = Field(..., description="Preferred job location")
     max_jobs: int = Field(default=10, description="Maximum number of jobs to process")
@@ -43,12 +60,22 @@ class JobApplicationRequest(BaseModel):
     education: str = Field(..., description="Educational background")
     # Optional fields
     user_profile: Optional[UserProfile] = Field(None, description="Complete user profile information")
-    job_sites: List[str] = Field(default=["indeed", "linkedin"], description="Job sites to scrape")
+    job_sites: List[str] = Field(default_factory=lambda: ["indeed", "linkedin"], description="Job sites to scrape")
     auto_apply: bool = Field(default=True, description="Automatically apply to jobs")
     email_template: Optional[str] = Field(None, description="Custom email template")
 
+class ScrapeJobsResponse(BaseModel):
+    """Response model for job scraping"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
+    success: bool = Field(..., description="Whether scraping succeeded")
+    jobs_found: int = Field(..., description="Number of jobs found")
+    jobs: List[JobPosting] = Field(default_factory=list, description="Scraped job postings")
+
 class JobApplicationResponse(BaseModel):
     """Response model for job application process"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     message: str = Field(..., description="Response message")
     status: str = Field(..., description="Process status")
     request_id: str = Field(..., description="Unique request identifier")
@@ -57,19 +84,36 @@ class JobApplicationResponse(BaseModel):
 
 class EmailRequest(BaseModel):
     """Request model for email generation"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     job_posting: JobPosting = Field(..., description="Job posting information")
     user_profile: UserProfile = Field(..., description="User profile information")
     email_type: str = Field(default="cover_letter", description="Type of email to generate")
 
+class SendEmailRequest(EmailRequest):
+    """Request model for sending a job application email"""
+    email_content: str = Field(..., description="Email content to send")
+
+class ProcessApplicationRequest(BaseModel):
+    """Request model for processing a single job application"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
+    job_posting: JobPosting = Field(..., description="Job posting information")
+    user_profile: UserProfile = Field(..., description="User profile information")
+
 class EmailResponse(BaseModel):
     """Response model for email generation"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     subject: str = Field(..., description="Email subject")
     content: str = Field(..., description="Email content")
     recipient_email: Optional[str] = Field(None, description="Recipient email address")
-    attachments: List[str] = Field(default=[], description="List of attachment URLs")
+    attachments: List[str] = Field(default_factory=list, description="List of attachment URLs")
 
 class ApplicationStatus(BaseModel):
     """Model for application status tracking"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     request_id: str = Field(..., description="Request identifier")
     status: str = Field(..., description="Current status")
     jobs_processed: int = Field(default=0, description="Number of jobs processed")
@@ -77,4 +121,4 @@ class ApplicationStatus(BaseModel):
     errors: int = Field(default=0, description="Number of errors encountered")
     start_time: datetime = Field(..., description="Process start time")
     end_time: Optional[datetime] = Field(None, description="Process end time")
-    details: Dict[str, Any] = Field(default={}, description="Additional details") 
\ No newline at end of file
+    details: Dict[str, Any] = Field(default_factory=dict, description="Additional details") 
\ No newline at end of file
@@ -1,35 +1,165 @@
 import asyncio
+import functools
+import hashlib
 import json
-from typing import Dict, Any, List
+from typing import AsyncIterator, Dict, Any, List, Tuple
 import logging
-from groq import Groq
-from jinja2 import Template
+import httpx
+import orjson
+from aiolimiter import AsyncLimiter
+from cachetools import LRUCache
+from groq import AsyncGroq, APIConnectionError, RateLimitError
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+from jinja2 import Environment, Template
 
 from models.schemas import JobPosting, UserProfile, EmailResponse
 from config.settings import settings
+from services.http_client import SHARED_HTTPX
 
 logger = logging.getLogger(__name__)
 
+# Prompt templates are plain text, so autoescaping stays off
+_JINJA_ENV = Environment(autoescape=False, cache_size=400)
+
+@functools.lru_cache(maxsize=256)
+def _compile(template_str: str) -> Template:
+    """Compile a custom template once and reuse it for identical strings"""
+    return _JINJA_ENV.from_string(template_str)
+
+# Appended to the rendered prompt so subject and body come back from one call
+_COMBINED_INSTRUCTIONS = """
+Return strict JSON with exactly two keys:
+- "subject": a professional email subject line under 60 characters
+- "body": the full email text
+"""
+
+# Static per-type strings, shared instead of rebuilt on every call
+_SYSTEM_PROMPTS = {
+    "cover_letter": "You are a professional job application assistant. Generate compelling cover letters that are personalized, professional, and highlight relevant experience.",
+    "follow_up": "You are a professional follow-up email assistant. Generate polite and professional follow-up emails for job applications.",
+    "networking": "You are a professional networking email assistant. Generate professional networking emails that are respectful and value-focused."
+}
+_DEFAULT_SYSTEM_PROMPT = "You are a professional email assistant. Generate professional and personalized emails."
+
+_FALLBACK_COVER = """
+Dear Hiring Manager,
+
+I am writing to express my strong interest in the [Position Title] role at [Company Name]. With my background in [relevant skills] and [X] years of experience, I am confident I would be a valuable addition to your team.
+
+I am particularly drawn to [Company Name] because of [specific reason]. My experience in [specific skill/area] aligns well with the requirements outlined in the job description.
+
+I would welcome the opportunity to discuss how my skills and experience can contribute to [Company Name]'s continued success. Thank you for considering my application.
+
+Best regards,
+[Your Name]
+"""
+
+_FALLBACK_FOLLOWUP = """
+Dear Hiring Manager,
+
+I hope this email finds you well. I wanted to follow up on my application for the [Position Title] role at [Company Name], which I submitted on [date].
+
+I remain very interested in this opportunity and would appreciate any updates on the status of my application. I am available for an interview at your convenience.
+
+Thank you for your time and consideration.
+
+Best regards,
+[Your Name]
+"""
+
+_FALLBACK_NETWORK = """
+Dear [Name],
+
+I hope this email finds you well. I am reaching out to connect and learn more about opportunities at [Company Name].
+
+With my background in [relevant skills], I am interested in exploring how I might contribute to your team. I would appreciate the opportunity to have a brief conversation about your experience at [Company Name].
+
+Thank you for your time.
+
+Best regards,
+[Your Name]
+"""
+
+_FALLBACKS = {
+    "cover_letter": _FALLBACK_COVER,
+    "follow_up": _FALLBACK_FOLLOWUP
+}
+
+# Transient Groq failures worth retrying; APIConnectionError also covers the SDK's timeouts
+_RETRYABLE = (RateLimitError, APIConnectionError, httpx.ReadTimeout)
+_backoff = wait_random_exponential(min=1, max=30)
+
+def _groq_wait(retry_state) -> float:
+    """Wait for Groq's advertised Retry-After when present, else back off exponentially with jitter"""
+    response = getattr(retry_state.outcome.exception(), "response", None)
+    if response is not None:
+        retry_after = response.headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(float(retry_after), 60.0)
+            except ValueError:
+                pass
+    return _backoff(retry_state)
+
+class _OwnerCancelled(Exception):
+    """Set on a shared in-flight future when the call that issued the request is cancelled"""
+
+# Bulk runs larger than this render job prompts in worker threads so the event
+# loop stays free to drive the in-flight Groq requests
+_THREADED_RENDER_THRESHOLD = 32
+
+# Jobs packed into one job-fit analysis call; bounded by the model's output token budget
+_FIT_BATCH_SIZE = 10
+
+def _unavailable_fit() -> Dict[str, Any]:
+    """Job-fit result used when the analysis call itself fails"""
+    return {
+        "fit_score": 50,
+        "matching_skills": [],
+        "missing_skills": [],
+        "recommendations": ["Unable to analyze job fit"],
+        "confidence_level": "low"
+    }
+
 class EmailGenerator:
     """Service for generating personalized emails using Groq LLM"""
     
     def __init__(self):
-        self.client = Groq(api_key=settings.GROQ_API_KEY)
+        # The async client yields to the event loop while Groq is generating;
+        # every instance shares the process-wide connection pool
+        self.client = AsyncGroq(
+            api_key=settings.GROQ_API_KEY,
+            http_client=SHARED_HTTPX,
+            max_retries=0  # retried in _complete, honoring Retry-After
+        )
         self.model = settings.GROQ_MODEL
+        
+        # Completed Groq responses keyed by a hash of the full request
+        self._resp_cache = LRUCache(maxsize=1024)
+        
+        # Futures for Groq requests currently on the wire, keyed like the cache
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
+        # Prompt-token usage reported by Groq, including the share served from its prompt cache
+        self._prompt_tokens = 0
+        self._cached_tokens = 0
+        
+        # Bound bulk generation by in-flight requests and by Groq's per-minute quota
+        self._sem = asyncio.Semaphore(settings.MAX_CONCURRENT_LLM)
+        self._limiter = AsyncLimiter(settings.GROQ_MAX_RPM, 60)
+        
         self.setup_templates()
     
     def setup_templates(self):
         """Setup email templates"""
+        # Each template is split into a user block (instructions plus applicant profile,
+        # identical across a bulk run) followed by a job block, so bulk prompts share
+        # a common prefix that is rendered once and hits Groq's prompt cache
         self.templates = {
-            "cover_letter": """
+            "cover_letter": {
+                "user": """
 You are a professional job application assistant. Generate a compelling cover letter for the following job posting.
 
-Job Details:
-- Title: {{ job.title }}
-- Company: {{ job.company }}
-- Location: {{ job.location }}
-- Description: {{ job.description }}
-
 Applicant Profile:
 - Name: {{ user.name }}
 - Experience: {{ user.experience_years }} years
@@ -44,16 +174,20 @@ Instructions:
 4. Keep it concise (200-300 words)
 5. Use a professional tone
 6. Include a clear call to action
-
-Generate the cover letter:
 """,
-            "follow_up": """
-You are a professional follow-up email assistant. Generate a polite follow-up email for a job application.
-
+                "job": """
 Job Details:
 - Title: {{ job.title }}
 - Company: {{ job.company }}
-- Applied Date: {{ applied_date }}
+- Location: {{ job.location }}
+- Description: {{ job.description }}
+
+Generate the cover letter:
+"""
+            },
+            "follow_up": {
+                "user": """
+You are a professional follow-up email assistant. Generate a polite follow-up email for a job application.
 
 Applicant Profile:
 - Name: {{ user.name }}
@@ -66,15 +200,20 @@ Instructions:
 4. Keep it brief and professional
 5. Ask about the status of the application
 6. Thank them for their time
+""",
+                "job": """
+Job Details:
+- Title: {{ job.title }}
+- Company: {{ job.company }}
+- Applied Date: {{ applied_date }}
 
 Generate the follow-up email:
-""",
-            "networking": """
+"""
+            },
+            "networking": {
+                "user": """
 You are a professional networking email assistant. Generate a networking email to connect with someone at a company.
 
-Company: {{ job.company }}
-Position of Interest: {{ job.title }}
-
 Applicant Profile:
 - Name: {{ user.name }}
 - Experience: {{ user.experience_years }} years
@@ -88,10 +227,26 @@ Instructions:
 4. Mention specific skills or experience relevant to the company
 5. Request an informational interview or connection
 6. Keep it concise and respectful
+""",
+                "job": """
+Company: {{ job.company }}
+Position of Interest: {{ job.title }}
 
 Generate the networking email:
 """
+            }
         }
+        self.compiled_user = {name: _JINJA_ENV.from_string(parts["user"]) for name, parts in self.templates.items()}
+        self.compiled_job = {name: _JINJA_ENV.from_string(parts["job"]) for name, parts in self.templates.items()}
+    
+    def _render_user_block(self, user_profile: UserProfile, email_type: str) -> str:
+        """Render the applicant part of a prompt, shared by every job in a bulk run"""
+        return self.compiled_user.get(email_type, self.compiled_user["cover_letter"]).render(user=user_profile)
+    
+    def _render_job_block(self, job_posting: JobPosting, email_type: str) -> str:
+        """Render the job-specific tail of a prompt"""
+        template = self.compiled_job.get(email_type, self.compiled_job["cover_letter"])
+        return template.render(job=job_posting, applied_date="recently")  # Could be made dynamic
     
     async def generate_email(self, job_posting: JobPosting, user_profile: UserProfile, 
                            email_type: str = "cover_letter", custom_template: str = None) -> EmailResponse:
@@ -99,67 +254,211 @@ Generate the networking email:
         Generate a personalized email for job application
         """
         try:
-            # Prepare context for template
-            context = {
-                "job": job_posting,
-                "user": user_profile,
-                "applied_date": "recently"  # Could be made dynamic
-            }
-            
-            # Get template
             if custom_template:
-                template_content = custom_template
+                # Prepare context for template
+                context = {
+                    "job": job_posting,
+                    "user": user_profile,
+                    "applied_date": "recently"  # Could be made dynamic
+                }
+                prompt = _compile(custom_template).render(**context)
             else:
-                template_content = self.templates.get(email_type, self.templates["cover_letter"])
-            
-            # Render template
-            template = Template(template_content)
-            prompt = template.render(**context)
+                prompt = self._render_user_block(user_profile, email_type) + self._render_job_block(job_posting, email_type)
             
-            # Generate email using Groq
-            email_content = await self._generate_with_groq(prompt, email_type)
-            
-            # Generate subject line
-            subject = await self._generate_subject(job_posting, email_type)
-            
-            # Determine recipient email
-            recipient_email = job_posting.hiring_manager_email or f"hiring@{job_posting.company.lower().replace(' ', '')}.com"
-            
-            return EmailResponse(
-                subject=subject,
-                content=email_content,
-                recipient_email=recipient_email,
-                attachments=[]
-            )
+            return await self._generate_from_prompt(prompt, job_posting, email_type)
             
         except Exception as e:
             logger.error(f"Error generating email: {e}")
             raise
     
-    async def _generate_with_groq(self, prompt: str, email_type: str) -> str:
-        """Generate email content using Groq LLM"""
+    async def _generate_from_prompt(self, prompt: str, job_posting: JobPosting, email_type: str) -> EmailResponse:
+        """Generate an email from a fully rendered prompt"""
+        # Generate subject and body in one Groq call, falling back to
+        # separate calls if the model returns malformed JSON
         try:
-            # Add specific instructions based on email type
-            if email_type == "cover_letter":
-                system_prompt = "You are a professional job application assistant. Generate compelling cover letters that are personalized, professional, and highlight relevant experience."
-            elif email_type == "follow_up":
-                system_prompt = "You are a professional follow-up email assistant. Generate polite and professional follow-up emails for job applications."
-            elif email_type == "networking":
-                system_prompt = "You are a professional networking email assistant. Generate professional networking emails that are respectful and value-focused."
-            else:
-                system_prompt = "You are a professional email assistant. Generate professional and personalized emails."
-            
-            response = self.client.chat.completions.create(
+            subject, email_content = await self._generate_combined(prompt, job_posting, email_type)
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Combined generation returned malformed JSON, using separate calls: {e}")
+            email_content = await self._generate_with_groq(prompt, email_type)
+            subject = await self._generate_subject(job_posting, email_type)
+        
+        # Determine recipient email
+        recipient_email = job_posting.hiring_manager_email or f"hiring@{job_posting.company.lower().replace(' ', '')}.com"
+        
+        return EmailResponse(
+            subject=subject,
+            content=email_content,
+            recipient_email=recipient_email,
+            attachments=[]
+        )
+    
+    async def generate_email_stream(self, job_posting: JobPosting, user_profile: UserProfile,
+                                    email_type: str = "cover_letter") -> AsyncIterator[str]:
+        """
+        Yield email text as Groq generates it, so callers can show or forward it before completion
+        """
+        system_prompt = self._system_prompt(email_type)
+        prompt = self._render_user_block(user_profile, email_type) + self._render_job_block(job_posting, email_type)
+        params = {"temperature": 0.7, "max_tokens": 1000}
+        
+        # Shares cache entries with _generate_with_groq, which sends the same request unstreamed
+        key = self._cache_key(system_prompt, prompt, params)
+        cached = self._resp_cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+        
+        try:
+            stream = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": prompt}
                 ],
+                stream=True,
+                **params
+            )
+        except Exception as e:
+            logger.error(f"Error with Groq API: {e}")
+            yield self._generate_fallback_email(email_type)
+            return
+        
+        parts = []
+        try:
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            # Text already sent can't be taken back, so end the stream where it broke
+            logger.error(f"Groq stream interrupted: {e}")
+            return
+        
+        text = "".join(parts)
+        if text:
+            self._resp_cache[key] = text
+    
+    def prompt_cache_stats(self) -> Dict[str, int]:
+        """Prompt tokens billed so far and how many of them Groq served from its prompt cache"""
+        return {
+            "prompt_tokens": self._prompt_tokens,
+            "cached_tokens": self._cached_tokens
+        }
+    
+    def _cache_key(self, system_prompt: str, prompt: str, params: Dict[str, Any]) -> str:
+        """Hash of everything that determines a completion"""
+        return hashlib.blake2b(
+            json.dumps([self.model, system_prompt, prompt, params], sort_keys=True).encode(),
+            digest_size=16
+        ).hexdigest()
+    
+    async def _complete(self, system_prompt: str, prompt: str, **params) -> str:
+        """Run a chat completion, serving repeated identical requests from the cache"""
+        key = self._cache_key(system_prompt, prompt, params)
+        
+        cached = self._resp_cache.get(key)
+        if cached is not None:
+            logger.debug("Groq response served from cache")
+            return cached
+        
+        # Concurrent identical requests share the first one's in-flight call
+        while (inflight := self._inflight.get(key)) is not None:
+            logger.debug("Groq request coalesced with an in-flight duplicate")
+            try:
+                return await asyncio.shield(inflight)
+            except _OwnerCancelled:
+                # Only the owning call was cancelled; take over the request instead
+                continue
+        
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            content = await self._request(system_prompt, prompt, params)
+        except asyncio.CancelledError:
+            # Told apart from a waiter's own cancellation, which still raises CancelledError
+            fut.set_exception(_OwnerCancelled())
+            fut.exception()
+            raise
+        except Exception as e:
+            fut.set_exception(e)
+            # Mark the exception retrieved so a future without waiters doesn't warn
+            fut.exception()
+            raise
+        else:
+            fut.set_result(content)
+        finally:
+            del self._inflight[key]
+        
+        if content:
+            self._resp_cache[key] = content
+        return content
+    
+    async def _request(self, system_prompt: str, prompt: str, params: Dict[str, Any]) -> str:
+        """Call Groq for one chat completion and return its text"""
+        # Rate limits and dropped connections are retried here so one 429 in a bulk
+        # batch doesn't degrade that email to the fallback template
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(5),
+            wait=_groq_wait,
+            retry=retry_if_exception_type(_RETRYABLE),
+            reraise=True
+        ):
+            with attempt:
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt}
+                    ],
+                    **params
+                )
+        
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            self._prompt_tokens += usage.prompt_tokens or 0
+            details = getattr(usage, "prompt_tokens_details", None)
+            self._cached_tokens += getattr(details, "cached_tokens", 0) or 0
+        
+        # Bind the first choice once and treat a missing choice or message as empty text
+        choice = (response.choices or [None])[0]
+        message = choice.message if choice else None
+        return (message.content if message else None) or ""
+    
+    def _system_prompt(self, email_type: str) -> str:
+        """Get the system prompt for an email type"""
+        return _SYSTEM_PROMPTS.get(email_type, _DEFAULT_SYSTEM_PROMPT)
+    
+    async def _generate_combined(self, prompt: str, job_posting: JobPosting, email_type: str) -> Tuple[str, str]:
+        """Generate subject line and email content with a single JSON-mode Groq call"""
+        try:
+            content = await self._complete(
+                self._system_prompt(email_type),
+                prompt + _COMBINED_INSTRUCTIONS,
+                response_format={"type": "json_object"},
+                temperature=0.7,
+                max_tokens=1100
+            )
+        except Exception as e:
+            logger.error(f"Error with Groq API: {e}")
+            # Fallback to the basic subject and template
+            return f"Application for {job_posting.title} Position", self._generate_fallback_email(email_type)
+        
+        # Malformed output raises here and the caller falls back to separate calls
+        data = orjson.loads(content)
+        return data["subject"].strip(), data["body"].strip()
+    
+    async def _generate_with_groq(self, prompt: str, email_type: str) -> str:
+        """Generate email content using Groq LLM"""
+        try:
+            content = await self._complete(
+                self._system_prompt(email_type),
+                prompt,
                 temperature=0.7,
                 max_tokens=1000
             )
             
-            return response.choices[0].message.content.strip()
+            return content.strip() or self._generate_fallback_email(email_type)
             
         except Exception as e:
             logger.error(f"Error with Groq API: {e}")
@@ -178,17 +477,14 @@ Generate the networking email:
             else:
                 subject_prompt = f"Generate a professional email subject line for {job_posting.title} position. Keep it under 60 characters."
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a professional email subject line generator. Generate concise, professional subject lines."},
-                    {"role": "user", "content": subject_prompt}
-                ],
+            content = await self._complete(
+                "You are a professional email subject line generator. Generate concise, professional subject lines.",
+                subject_prompt,
                 temperature=0.5,
                 max_tokens=50
             )
             
-            return response.choices[0].message.content.strip()
+            return content.strip() or f"Application for {job_posting.title} Position"
             
         except Exception as e:
             logger.error(f"Error generating subject: {e}")
@@ -197,72 +493,50 @@ Generate the networking email:
     
     def _generate_fallback_email(self, email_type: str) -> str:
         """Generate a fallback email when LLM fails"""
-        if email_type == "cover_letter":
-            return """
-Dear Hiring Manager,
-
-I am writing to express my strong interest in the [Position Title] role at [Company Name]. With my background in [relevant skills] and [X] years of experience, I am confident I would be a valuable addition to your team.
-
-I am particularly drawn to [Company Name] because of [specific reason]. My experience in [specific skill/area] aligns well with the requirements outlined in the job description.
-
-I would welcome the opportunity to discuss how my skills and experience can contribute to [Company Name]'s continued success. Thank you for considering my application.
-
-Best regards,
-[Your Name]
-"""
-        elif email_type == "follow_up":
-            return """
-Dear Hiring Manager,
-
-I hope this email finds you well. I wanted to follow up on my application for the [Position Title] role at [Company Name], which I submitted on [date].
-
-I remain very interested in this opportunity and would appreciate any updates on the status of my application. I am available for an interview at your convenience.
-
-Thank you for your time and consideration.
-
-Best regards,
-[Your Name]
-"""
-        else:
-            return """
-Dear [Name],
-
-I hope this email finds you well. I am reaching out to connect and learn more about opportunities at [Company Name].
-
-With my background in [relevant skills], I am interested in exploring how I might contribute to your team. I would appreciate the opportunity to have a brief conversation about your experience at [Company Name].
-
-Thank you for your time.
-
-Best regards,
-[Your Name]
-"""
+        return _FALLBACKS.get(email_type, _FALLBACK_NETWORK)
     
     async def generate_bulk_emails(self, jobs: List[JobPosting], user_profile: UserProfile, 
                                  email_type: str = "cover_letter") -> List[EmailResponse]:
-        """Generate emails for multiple jobs"""
-        emails = []
+        """Generate emails for multiple jobs concurrently"""
+        # The applicant block is identical for every job, so render it once and keep
+        # it at the front of each prompt where Groq can reuse the cached prefix
+        user_block = self._render_user_block(user_profile, email_type)
+        offload = len(jobs) > _THREADED_RENDER_THRESHOLD
         
-        for job in jobs:
-            try:
-                email = await self.generate_email(job, user_profile, email_type)
-                emails.append(email)
-                # Add delay to avoid rate limiting
-                await asyncio.sleep(1)
-            except Exception as e:
-                logger.error(f"Error generating email for job {job.title}: {e}")
+        tasks = [
+            asyncio.create_task(self._gen_one(user_block, job, email_type, offload))
+            for job in jobs
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        emails = []
+        for job, result in zip(jobs, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error generating email for job {job.title}: {result}")
                 continue
+            emails.append(result)
         
+        logger.info(f"Bulk generation prompt cache: {self.prompt_cache_stats()}")
         return emails
     
+    async def _gen_one(self, user_block: str, job: JobPosting, email_type: str,
+                       offload: bool = False) -> EmailResponse:
+        """Generate one bulk email under the concurrency and rate limits"""
+        async with self._sem, self._limiter:
+            if offload:
+                job_block = await asyncio.to_thread(self._render_job_block, job, email_type)
+            else:
+                job_block = self._render_job_block(job, email_type)
+            prompt = user_block + job_block
+            return await self._generate_from_prompt(prompt, job, email_type)
+    
     async def analyze_job_fit(self, job_posting: JobPosting, user_profile: UserProfile) -> Dict[str, Any]:
         """Analyze how well a job fits the user's profile"""
         try:
             analysis_prompt = f"""
 Analyze the fit between the job posting and the candidate profile.
 
-Job: {job_posting.title} at {job_posting.company}
-Job Requirements: {', '.join(job_posting.requirements)}
-Job Description: {job_posting.description[:500]}...
+Job: {job_posting.prompt_snippet}...
 
 Candidate Skills: {', '.join(user_profile.skills)}
 Candidate Experience: {user_profile.experience_years} years
@@ -276,22 +550,17 @@ Provide a JSON response with:
 5. confidence_level (high/medium/low)
 """
 
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a job matching analyst. Provide detailed analysis in JSON format."},
-                    {"role": "user", "content": analysis_prompt}
-                ],
+            content = await self._complete(
+                "You are a job matching analyst. Provide detailed analysis in JSON format.",
+                analysis_prompt,
                 temperature=0.3,
                 max_tokens=500
             )
             
-            analysis_text = response.choices[0].message.content.strip()
-            
-            # Try to parse JSON response
+            # Try to parse JSON response; an empty reply takes the same fallback
             try:
-                return json.loads(analysis_text)
-            except json.JSONDecodeError:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
                 # Fallback analysis
                 return {
                     "fit_score": 70,
@@ -303,10 +572,75 @@ Provide a JSON response with:
                 
         except Exception as e:
             logger.error(f"Error analyzing job fit: {e}")
-            return {
-                "fit_score": 50,
-                "matching_skills": [],
-                "missing_skills": [],
-                "recommendations": ["Unable to analyze job fit"],
-                "confidence_level": "low"
-            } 
\ No newline at end of file
+            return _unavailable_fit()
+    
+    async def analyze_job_fit_bulk(self, jobs: List[JobPosting], user_profile: UserProfile) -> List[Dict[str, Any]]:
+        """Analyze many jobs against one profile, packing several jobs into each Groq call"""
+        chunks = [jobs[i:i + _FIT_BATCH_SIZE] for i in range(0, len(jobs), _FIT_BATCH_SIZE)]
+        results = await asyncio.gather(*(self._analyze_fit_chunk(chunk, user_profile) for chunk in chunks))
+        return [analysis for chunk_results in results for analysis in chunk_results]
+    
+    async def _analyze_fit_chunk(self, jobs: List[JobPosting], user_profile: UserProfile) -> List[Dict[str, Any]]:
+        """Analyze one chunk of jobs, splitting it in half when the batched reply is unusable"""
+        if len(jobs) == 1:
+            async with self._sem, self._limiter:
+                return [await self.analyze_job_fit(jobs[0], user_profile)]
+        
+        listing = json.dumps([
+            {
+                "id": i,
+                "title": job.title,
+                "company": job.company,
+                "requirements": job.requirements,
+                "description": job.description[:500]
+            }
+            for i, job in enumerate(jobs)
+        ])
+        
+        analysis_prompt = f"""
+Analyze the fit between each job posting and the candidate profile.
+
+Jobs:
+{listing}
+
+Candidate Skills: {', '.join(user_profile.skills)}
+Candidate Experience: {user_profile.experience_years} years
+Candidate Education: {user_profile.education}
+
+Return a JSON object with a single key "results" holding an array where element i is the analysis for the job with id i.
+Each analysis has:
+1. fit_score (0-100)
+2. matching_skills (list of skills that match)
+3. missing_skills (list of skills the candidate lacks)
+4. recommendations (list of suggestions to improve fit)
+5. confidence_level (high/medium/low)
+"""
+        
+        try:
+            async with self._sem, self._limiter:
+                content = await self._complete(
+                    "You are a job matching analyst. Provide detailed analysis in JSON format.",
+                    analysis_prompt,
+                    response_format={"type": "json_object"},
+                    temperature=0.3,
+                    max_tokens=400 * len(jobs)
+                )
+        except Exception as e:
+            logger.error(f"Error analyzing job fit: {e}")
+            return [_unavailable_fit() for _ in jobs]
+        
+        try:
+            results = orjson.loads(content)["results"]
+            if not isinstance(results, list) or len(results) != len(jobs):
+                raise ValueError(f"expected {len(jobs)} analyses")
+            return results
+            
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            # Halving bounds the retries to log2(chunk size) extra rounds
+            logger.warning(f"Batched job-fit reply unusable for {len(jobs)} jobs, splitting: {e}")
+            mid = len(jobs) // 2
+            first, second = await asyncio.gather(
+                self._analyze_fit_chunk(jobs[:mid], user_profile),
+                self._analyze_fit_chunk(jobs[mid:], user_profile)
+            )
+            return first + second 
\ No newline at end of file
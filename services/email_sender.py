@@ -1,19 +1,93 @@
 import smtplib
 import ssl
+import aiosmtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
-from email import encoders
+from email import policy
+from email.generator import BytesGenerator
+from email.message import Message
 from typing import List, Dict, Any, Optional
 import logging
 import asyncio
+import base64
+import io
+import time
 from datetime import datetime
 import os
+from aiolimiter import AsyncLimiter
+from cachetools import LRUCache, cached
+from jinja2 import Environment
 
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Second the cached timestamp was formatted for, and its ISO string
+_last_ts = [0, ""]
+
+def _now_iso() -> str:
+    """Current local time as a second-precision ISO-8601 string, formatted at most once per second"""
+    t = int(time.time())
+    if t != _last_ts[0]:
+        _last_ts[0] = t
+        _last_ts[1] = datetime.fromtimestamp(t).isoformat()
+    return _last_ts[1]
+
+def _flatten(msg: Message) -> bytes:
+    """Serialize a message to SMTP wire format (CRLF, 8-bit clean)"""
+    buf = io.BytesIO()
+    BytesGenerator(buf, policy=policy.SMTP).flatten(msg)
+    return buf.getvalue()
+
+# Pooled sessions idle longer than this are probed with NOOP before reuse
+_IDLE_NOOP_SECONDS = 60
+
+# Read size for attachments; a multiple of 57 bytes so every chunk encodes to whole 76-char base64 lines
+_ATTACHMENT_CHUNK = 57 * 1024
+
+# Parsed once at import; autoescape keeps job and profile values from injecting markup
+_APPLICATION_HTML = """
+            <html>
+            <body>
+                <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+                    <div style="background-color: #f8f9fa; padding: 20px; border-radius: 5px;">
+                        <h2 style="color: #333;">Job Application</h2>
+                        <p><strong>Position:</strong> {{ job.get('title', 'N/A') }}</p>
+                        <p><strong>Company:</strong> {{ job.get('company', 'N/A') }}</p>
+                        <p><strong>Applicant:</strong> {{ user.get('name', 'N/A') }}</p>
+                    </div>
+                    <div style="padding: 20px;">
+                        {{ body | replace('\\n', '<br>' | safe) }}
+                    </div>
+                    <div style="background-color: #f8f9fa; padding: 20px; border-radius: 5px; margin-top: 20px;">
+                        <p><strong>Contact Information:</strong></p>
+                        <p>Email: {{ user.get('email', 'N/A') }}</p>
+                        <p>Phone: {{ user.get('phone', 'N/A') }}</p>
+                        <p>Location: {{ user.get('location', 'N/A') }}</p>
+                        {% if user.get('linkedin_url') %}<p>LinkedIn: <a href="{{ user.linkedin_url }}">{{ user.linkedin_url }}</a></p>{% endif %}
+                    </div>
+                </div>
+            </body>
+            </html>
+            """
+
+_APPLICATION_TEMPLATE = Environment(autoescape=True).from_string(_APPLICATION_HTML)
+
+# Encoded attachments kept for reuse, bounded by total encoded size rather than entry
+# count; a file larger than the whole budget is simply encoded on every send
+_ATTACHMENT_CACHE_BYTES = 16 * 1024 * 1024
+
+@cached(LRUCache(maxsize=_ATTACHMENT_CACHE_BYTES, getsizeof=len))
+def _encode_attachment(file_path: str, mtime_ns: int, size: int) -> str:
+    """Base64-encode a file in fixed chunks, memoized per (path, mtime, size) so a batch encodes each file once"""
+    buf = io.BytesIO()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(_ATTACHMENT_CHUNK):
+            buf.write(base64.encodebytes(chunk))
+    
+    return buf.getvalue().decode("ascii")
+
 class EmailSender:
     """Service for sending emails via SMTP"""
     
@@ -24,6 +98,16 @@ class EmailSender:
         self.password = settings.SMTP_PASSWORD
         self.from_email = settings.EMAIL_FROM
         
+        # Authenticated SMTP sessions reused across sends, stored with their last-used time.
+        # A (None, 0.0) entry is a free slot left by a dropped session, so a waiter wakes
+        # and opens a replacement; _open_connections counts sessions plus free slots
+        self._pool_size = settings.SMTP_POOL_SIZE
+        self._pool: asyncio.Queue = asyncio.Queue(maxsize=self._pool_size)
+        self._open_connections = 0
+        
+        # Token bucket shared by bulk sends so providers' per-minute caps are respected
+        self._limiter = AsyncLimiter(settings.SMTP_MAX_PER_MINUTE, 60)
+        
         # Validate settings
         if not all([self.username, self.password, self.from_email]):
             logger.warning("Email settings not fully configured. Email sending will be disabled.")
@@ -37,19 +121,8 @@ class EmailSender:
             if not all([self.username, self.password, self.from_email]):
                 raise ValueError("Email settings not configured")
             
-            # Create message
-            msg = MIMEMultipart()
-            msg['From'] = f"{from_name} <{self.from_email}>" if from_name else self.from_email
+            msg = await self._build_message(subject, content, attachments, from_name)
             msg['To'] = to_email
-            msg['Subject'] = subject
-            
-            # Add body
-            msg.attach(MIMEText(content, 'html'))
-            
-            # Add attachments
-            if attachments:
-                for attachment_path in attachments:
-                    await self._add_attachment(msg, attachment_path)
             
             # Send email
             result = await self._send_smtp_email(msg)
@@ -60,7 +133,7 @@ class EmailSender:
                 "message": "Email sent successfully",
                 "to_email": to_email,
                 "subject": subject,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
             
         except Exception as e:
@@ -70,29 +143,143 @@ class EmailSender:
                 "message": f"Failed to send email: {str(e)}",
                 "to_email": to_email,
                 "subject": subject,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
     
+    async def _build_message(self, subject: str, content: str,
+                             attachments: List[str] = None, from_name: str = None) -> MIMEMultipart:
+        """Build a message with body and attachments but no recipient"""
+        msg = MIMEMultipart()
+        msg['From'] = f"{from_name} <{self.from_email}>" if from_name else self.from_email
+        msg['Subject'] = subject
+        
+        # Add body
+        msg.attach(MIMEText(content, 'html'))
+        
+        # Add attachments
+        if attachments:
+            for attachment_path in attachments:
+                await self._add_attachment(msg, attachment_path)
+        
+        return msg
+    
     async def _send_smtp_email(self, msg: MIMEMultipart) -> bool:
-        """Send email via SMTP"""
+        """Send email via a pooled SMTP connection"""
+        return await self._send_raw(msg['To'], _flatten(msg))
+    
+    async def _send_raw(self, to_email: str, data: bytes) -> bool:
+        """Send an already serialized message via a pooled SMTP connection"""
+        return await self._deliver(lambda server: server.sendmail(self.from_email, [to_email], data))
+    
+    async def _deliver(self, send) -> bool:
+        """Run a send coroutine on a pooled connection, reconnecting once if the session was dropped"""
+        server = await self._acquire()
+        healthy = False
+        
         try:
-            # Create secure SSL/TLS context
-            context = ssl.create_default_context()
+            try:
+                await send(server)
+            except aiosmtplib.SMTPServerDisconnected:
+                # The server dropped the pooled session; reconnect once and retry
+                server.close()
+                server = await self._connect()
+                await send(server)
             
-            # Connect to SMTP server
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls(context=context)
-                server.login(self.username, self.password)
-                
-                # Send email
-                text = msg.as_string()
-                server.sendmail(self.from_email, msg['To'], text)
-                
+            healthy = True
             return True
             
+        except (aiosmtplib.SMTPResponseException, aiosmtplib.SMTPRecipientsRefused) as e:
+            # The server rejected this message but the session is still usable
+            healthy = True
+            logger.error(f"SMTP error: {e}")
+            raise
+            
         except Exception as e:
             logger.error(f"SMTP error: {e}")
             raise
+            
+        finally:
+            if healthy:
+                self._release(server)
+            else:
+                self._discard(server)
+    
+    async def _connect(self) -> aiosmtplib.SMTP:
+        """Open an authenticated SMTP connection"""
+        # Create secure SSL/TLS context
+        context = ssl.create_default_context()
+        
+        server = aiosmtplib.SMTP(hostname=self.smtp_server, port=self.smtp_port, start_tls=False)
+        try:
+            await server.connect()
+            await server.starttls(tls_context=context)
+            await server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        
+        return server
+    
+    async def _acquire(self) -> aiosmtplib.SMTP:
+        """Take a live connection from the pool, opening a new one while below the pool size"""
+        try:
+            server, last_used = self._pool.get_nowait()
+        except asyncio.QueueEmpty:
+            if self._open_connections < self._pool_size:
+                self._open_connections += 1
+                server, last_used = None, 0.0
+            else:
+                server, last_used = await self._pool.get()
+        
+        if server is None:
+            return await self._open_slot()
+        
+        if time.monotonic() - last_used > _IDLE_NOOP_SECONDS:
+            try:
+                response = await server.noop()
+                if response.code != 250:
+                    raise aiosmtplib.SMTPServerDisconnected(f"NOOP returned {response.code}")
+            except (aiosmtplib.SMTPException, OSError):
+                server.close()
+                return await self._open_slot()
+        
+        return server
+    
+    async def _open_slot(self) -> aiosmtplib.SMTP:
+        """Connect into a slot this caller holds, handing the slot back to waiters on failure"""
+        try:
+            return await self._connect()
+        except Exception:
+            self._pool.put_nowait((None, 0.0))
+            raise
+    
+    def _release(self, server: aiosmtplib.SMTP):
+        """Return a healthy connection to the pool"""
+        self._pool.put_nowait((server, time.monotonic()))
+    
+    def _discard(self, server: aiosmtplib.SMTP):
+        """Drop a broken connection, freeing its slot for a replacement"""
+        try:
+            server.close()
+        finally:
+            self._pool.put_nowait((None, 0.0))
+    
+    async def aclose(self):
+        """Close every pooled SMTP connection"""
+        while True:
+            try:
+                server, _ = self._pool.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            
+            self._open_connections -= 1
+            if server is None:
+                continue
+            
+            try:
+                await server.quit()
+            except Exception:
+                server.close()
     
     async def _add_attachment(self, msg: MIMEMultipart, file_path: str):
         """Add attachment to email"""
@@ -101,11 +288,10 @@ class EmailSender:
                 logger.warning(f"Attachment file not found: {file_path}")
                 return
             
-            with open(file_path, "rb") as attachment:
-                part = MIMEBase('application', 'octet-stream')
-                part.set_payload(attachment.read())
-            
-            encoders.encode_base64(part)
+            part = MIMEBase('application', 'octet-stream')
+            st = os.stat(file_path)
+            part.set_payload(_encode_attachment(file_path, st.st_mtime_ns, st.st_size))
+            part['Content-Transfer-Encoding'] = 'base64'
             part.add_header(
                 'Content-Disposition',
                 f'attachment; filename= {os.path.basename(file_path)}'
@@ -116,39 +302,110 @@ class EmailSender:
         except Exception as e:
             logger.error(f"Error adding attachment {file_path}: {e}")
     
-    async def send_bulk_emails(self, emails: List[Dict[str, Any]], 
-                             delay_between_emails: float = 2.0) -> List[Dict[str, Any]]:
+    async def send_bulk_emails(self, emails: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Send multiple emails with delay between each
+        Send multiple emails concurrently over the connection pool
         """
-        results = []
+        # A batch that only differs by recipient is serialized once instead of per email
+        first = emails[0] if emails else None
+        if len(emails) > 1 and 'subject' in first and 'content' in first and all(
+            'to_email' in e
+            and e.get('subject') == first.get('subject')
+            and e.get('content') == first.get('content')
+            and e.get('attachments', []) == first.get('attachments', [])
+            for e in emails
+        ):
+            return await self.send_bulk_identical(
+                [e['to_email'] for e in emails],
+                first['subject'],
+                first['content'],
+                first.get('attachments', [])
+            )
         
-        for email_data in emails:
-            try:
-                result = await self.send_email(
+        sem = asyncio.Semaphore(self._pool_size)
+        
+        async def _bounded(email_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with sem, self._limiter:
+                return await self.send_email(
                     to_email=email_data['to_email'],
                     subject=email_data['subject'],
                     content=email_data['content'],
                     attachments=email_data.get('attachments', [])
                 )
-                results.append(result)
-                
-                # Add delay between emails to avoid rate limiting
-                if delay_between_emails > 0:
-                    await asyncio.sleep(delay_between_emails)
-                    
-            except Exception as e:
-                logger.error(f"Error in bulk email sending: {e}")
+        
+        tasks = [asyncio.create_task(_bounded(email_data)) for email_data in emails]
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        results = []
+        for email_data, outcome in zip(emails, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Error in bulk email sending: {outcome}")
                 results.append({
                     "success": False,
-                    "message": f"Failed to send email: {str(e)}",
+                    "message": f"Failed to send email: {str(outcome)}",
                     "to_email": email_data.get('to_email', 'unknown'),
                     "subject": email_data.get('subject', 'unknown'),
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": _now_iso()
                 })
+            else:
+                results.append(outcome)
         
         return results
     
+    async def send_bulk_identical(self, recipients: List[str], subject: str, content: str,
+                                  attachments: List[str] = None, from_name: str = None) -> List[Dict[str, Any]]:
+        """
+        Send the same email to many recipients, building and serializing the message once
+        """
+        try:
+            if not all([self.username, self.password, self.from_email]):
+                raise ValueError("Email settings not configured")
+            
+            # Attachments are encoded and the MIME tree flattened once for the whole batch;
+            # each recipient only gets its own To header prepended
+            data = _flatten(await self._build_message(subject, content, attachments, from_name))
+            
+        except Exception as e:
+            logger.error(f"Error building bulk email: {e}")
+            return [{
+                "success": False,
+                "message": f"Failed to send email: {str(e)}",
+                "to_email": to_email,
+                "subject": subject,
+                "timestamp": _now_iso()
+            } for to_email in recipients]
+        
+        sem = asyncio.Semaphore(self._pool_size)
+        
+        async def _send_one(to_email: str) -> Dict[str, Any]:
+            try:
+                if "\r" in to_email or "\n" in to_email:
+                    raise ValueError("Invalid recipient address")
+                
+                async with sem, self._limiter:
+                    await self._send_raw(to_email, f"To: {to_email}\r\n".encode() + data)
+                
+                logger.info(f"Email sent successfully to {to_email}")
+                return {
+                    "success": True,
+                    "message": "Email sent successfully",
+                    "to_email": to_email,
+                    "subject": subject,
+                    "timestamp": _now_iso()
+                }
+                
+            except Exception as e:
+                logger.error(f"Error sending email to {to_email}: {e}")
+                return {
+                    "success": False,
+                    "message": f"Failed to send email: {str(e)}",
+                    "to_email": to_email,
+                    "subject": subject,
+                    "timestamp": _now_iso()
+                }
+        
+        return await asyncio.gather(*(_send_one(to_email) for to_email in recipients))
+    
     async def send_job_application_email(self, job_data: Dict[str, Any], 
                                        user_profile: Dict[str, Any],
                                        email_content: str) -> Dict[str, Any]:
@@ -157,30 +414,7 @@ class EmailSender:
         """
         try:
             # Format email content as HTML
-            html_content = f"""
-            <html>
-            <body>
-                <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-                    <div style="background-color: #f8f9fa; padding: 20px; border-radius: 5px;">
-                        <h2 style="color: #333;">Job Application</h2>
-                        <p><strong>Position:</strong> {job_data.get('title', 'N/A')}</p>
-                        <p><strong>Company:</strong> {job_data.get('company', 'N/A')}</p>
-                        <p><strong>Applicant:</strong> {user_profile.get('name', 'N/A')}</p>
-                    </div>
-                    <div style="padding: 20px;">
-                        {email_content.replace(chr(10), '<br>')}
-                    </div>
-                    <div style="background-color: #f8f9fa; padding: 20px; border-radius: 5px; margin-top: 20px;">
-                        <p><strong>Contact Information:</strong></p>
-                        <p>Email: {user_profile.get('email', 'N/A')}</p>
-                        <p>Phone: {user_profile.get('phone', 'N/A')}</p>
-                        <p>Location: {user_profile.get('location', 'N/A')}</p>
-                        {f'<p>LinkedIn: <a href="{user_profile.get("linkedin_url")}">{user_profile.get("linkedin_url")}</a></p>' if user_profile.get('linkedin_url') else ''}
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
+            html_content = _APPLICATION_TEMPLATE.render(job=job_data, user=user_profile, body=email_content)
             
             # Send email
             result = await self.send_email(
@@ -197,7 +431,7 @@ class EmailSender:
             return {
                 "success": False,
                 "message": f"Failed to send job application email: {str(e)}",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
     
     async def send_follow_up_email(self, job_data: Dict[str, Any], 
@@ -234,7 +468,7 @@ class EmailSender:
             return {
                 "success": False,
                 "message": f"Failed to send follow-up email: {str(e)}",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
     
     def test_connection(self) -> bool:
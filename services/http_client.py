@@ -0,0 +1,10 @@
+import httpx
+
+# One HTTP/2 connection pool shared by every outbound API client in the process,
+# so TLS setup is paid once and concurrent requests multiplex over warm connections.
+# Closed by the application (and worker) shutdown hooks.
+SHARED_HTTPX = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=200, max_keepalive_connections=100, keepalive_expiry=30),
+    timeout=httpx.Timeout(30.0, connect=5.0)
+)
\ No newline at end of file
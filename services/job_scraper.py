@@ -1,73 +1,459 @@
 import asyncio
+import atexit
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.util import Finalize
+import hashlib
+import json
+import threading
+from collections import defaultdict
 import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from selectolax.parser import HTMLParser
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
-from typing import List, Dict, Any
+from aiolimiter import AsyncLimiter
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential
+from typing import AsyncIterator, List, Dict, Any, Optional
 import time
 import re
 import logging
-from urllib.parse import urljoin, urlparse
+from urllib.parse import quote, urlencode, urljoin, urlparse
 
 from models.schemas import JobPosting
 from config.settings import settings
+from services.seen_jobs import SeenJobStore, job_hash
 
 logger = logging.getLogger(__name__)
 
+# Markers of captcha/challenge pages served instead of search results
+_BLOCK_MARKERS = ("captcha", "cf-challenge", "just a moment", "verify you are human", "unusual traffic")
+
+def _looks_blocked(html: str) -> bool:
+    """Whether a fetched page is an anti-bot interstitial rather than real content"""
+    head = html[:20000].lower()
+    return any(marker in head for marker in _BLOCK_MARKERS)
+
+# Headless Chrome flags that trim startup work and per-tab memory; images are never
+# needed to read job cards, and the disk cache lets repeat runs reuse site JS/CSS
+_CHROME_ARGS = (
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-translate",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    "--disable-features=TranslateUI,BlinkGenPropertyTrees",
+    "--blink-settings=imagesEnabled=false",
+    "--disk-cache-dir=/tmp/chrome-cache",
+    "--disk-cache-size=104857600",
+)
+
+# Browser worker processes; one per site so fallbacks for different sites run in parallel
+_BROWSER_WORKERS = 3
+
+# Upper bound on waiting for a browser page to render the elements being scraped
+_PAGE_WAIT_SECONDS = 10
+
+# Statuses job boards answer bots with; other errors (404, 410, 5xx) mean the page
+# itself is gone or broken, which a browser wouldn't fix
+_BLOCKED_STATUSES = (403, 503)
+
+# Hosts whose pages may be retried in a browser; only Indeed's challenge needs one
+_BROWSER_HOSTS = ("indeed.com",)
+
+def _browser_allowed(url: str) -> bool:
+    """Whether a page blocked over HTTP may fall back to Selenium"""
+    host = urlparse(url).hostname or ""
+    return any(host == allowed or host.endswith("." + allowed) for allowed in _BROWSER_HOSTS)
+
+# Responses worth parsing; anything else (PDFs, images, huge dynamic pages) is dropped
+# from its headers or once the body passes the cap, before more is downloaded
+_HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+_MAX_PAGE_BYTES = 2_000_000
+
+_backoff = wait_exponential(multiplier=1, min=1, max=10)
+
+def _fetch_wait(retry_state) -> float:
+    """Wait for a site's advertised Retry-After on a 429 when present, else back off exponentially"""
+    error = retry_state.outcome.exception()
+    if isinstance(error, aiohttp.ClientResponseError) and error.headers:
+        retry_after = error.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(float(retry_after), 60.0)
+            except ValueError:
+                pass
+    return _backoff(retry_state)
+
+def _install_driver() -> str:
+    """Path to chromedriver: CHROMEDRIVER_PATH when set, else found or downloaded by webdriver-manager"""
+    return settings.CHROMEDRIVER_PATH or ChromeDriverManager().install()
+
+# chromedriver binary path, handed to browser workers by the parent or resolved on first use
+_DRIVER_PATH: Optional[str] = None
+
+def _driver_path() -> str:
+    """Path to chromedriver, installing it on first call"""
+    global _DRIVER_PATH
+    if _DRIVER_PATH is None:
+        _DRIVER_PATH = _install_driver()
+    return _DRIVER_PATH
+
+# Chromedriver lookup for this process, started by its first browser fallback (Selenium
+# is a rare Indeed-only path, so startup never pays for it) and handed to every worker
+_DRIVER_PATH_FUTURE: Optional[Future] = None
+
+def _start_driver_lookup() -> Future:
+    """Resolve chromedriver on a daemon thread, once per process"""
+    global _DRIVER_PATH_FUTURE
+    if _DRIVER_PATH_FUTURE is not None:
+        return _DRIVER_PATH_FUTURE
+    
+    future = Future()
+    _DRIVER_PATH_FUTURE = future
+    
+    # A preinstalled driver needs no webdriver-manager lookup at all
+    if settings.CHROMEDRIVER_PATH:
+        future.set_result(settings.CHROMEDRIVER_PATH)
+        return future
+    
+    def _resolve():
+        try:
+            future.set_result(_install_driver())
+        except Exception as e:
+            future.set_exception(e)
+    
+    # Daemon, so a process that exits early doesn't wait on the download
+    threading.Thread(target=_resolve, name="chromedriver", daemon=True).start()
+    return future
+
+# Selector-map keys that aren't text fields of the card
+_STRUCTURAL_KEYS = ("card", "link")
+
+def _cards_script(selectors: Dict[str, str]) -> str:
+    """In-page extractor for the Selenium fallback, returning every card's fields in one call"""
+    fields = "".join(
+        f"    {name}: c.querySelector({json.dumps(selector)})?.innerText,\n"
+        for name, selector in selectors.items() if name not in _STRUCTURAL_KEYS
+    )
+    return (
+        f"return Array.from(document.querySelectorAll({json.dumps(selectors['card'])})).map(c => ({{\n"
+        f"{fields}"
+        f"    job_url: c.querySelector({json.dumps(selectors['link'])})?.href\n"
+        f"}}));"
+    )
+
+def _parse_card(card, selectors: Dict[str, str], base_url: str) -> Optional[Dict[str, Any]]:
+    """Job data from a card in static HTML, read with the same selector map as the browser path"""
+    fields = {}
+    for name, selector in selectors.items():
+        if name not in _STRUCTURAL_KEYS:
+            node = card.css_first(selector)
+            fields[name] = _node_text(node) if node is not None else None
+    
+    link = card.css_first(selectors["link"])
+    href = link.attributes.get("href") if link is not None else None
+    fields["job_url"] = urljoin(base_url, href) if href else None
+    
+    return _job_data(fields)
+
+def _job_data(fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Job data from extracted card fields, or None if a required field is missing"""
+    if not all(fields.get(key) for key in ("title", "company", "location", "job_url")):
+        return None
+    
+    return {
+        "title": fields["title"].strip(),
+        "company": fields["company"].strip(),
+        "location": fields["location"].strip(),
+        "description": (fields.get("description") or "").strip(),
+        "job_url": fields["job_url"],
+        "requirements": [],
+        "salary_range": None,
+        "hiring_manager_email": None,
+        "application_deadline": None,
+        "job_type": None,
+        "remote_option": None
+    }
+
+_TITLE_TOKEN_RE = re.compile(r"\w+")
+
+def _job_signature(job: JobPosting) -> tuple:
+    """Key shared by near-duplicate postings: the same company and title words in any order"""
+    return (job.company.strip().lower(), tuple(sorted(_TITLE_TOKEN_RE.findall(job.title.lower()))))
+
+def _dedupe_jobs(jobs: List[JobPosting]) -> List[JobPosting]:
+    """Collapse postings listed on several boards, keeping the most detailed copy of each"""
+    exact = set()
+    best: Dict[tuple, JobPosting] = {}
+    
+    for job in jobs:
+        # Exact repeats are dropped on a short hash before any normalization work
+        digest = hashlib.blake2b(f"{job.title}|{job.company}|{job.location}".encode(), digest_size=8).digest()
+        if digest in exact:
+            continue
+        exact.add(digest)
+        
+        signature = _job_signature(job)
+        kept = best.get(signature)
+        if kept is None or len(job.description) + len(job.requirements) > len(kept.description) + len(kept.requirements):
+            best[signature] = job
+    
+    return list(best.values())
+
+def _parse_details(tree: HTMLParser) -> Dict[str, Any]:
+    """Description and requirements from a parsed job page"""
+    return {
+        "description": _text(tree, ".job-description"),
+        "requirements": [_node_text(li) for li in tree.css(".job-requirements li")]
+    }
+
+def _text(card, selector: str) -> str:
+    """Stripped text of the first element matching selector inside a parsed card, or "" if absent"""
+    node = card.css_first(selector)
+    return _node_text(node) if node is not None else ""
+
+def _node_text(node) -> str:
+    """Text of a parsed element with inline markup read as words, whitespace collapsed like innerText"""
+    # text(strip=True) strips each text node and joins them with nothing, gluing
+    # "<b>Senior</b> <b>Engineer</b>" into "SeniorEngineer"
+    return " ".join(node.text().split())
+
 class JobScraper:
     """Service for scraping job postings from various job sites"""
     
+    # Selenium is thread-hostile and drives one page at a time, so browser fallbacks run
+    # in a small process pool. Each worker process holds one long-lived browser in
+    # _driver, started the first time that worker is handed a page
+    _driver = None
+    _browser_pool: Optional[ProcessPoolExecutor] = None
+    
+    # Per-site card selectors, shared by the static parser and the in-page browser extractor
+    INDEED_SELECTORS = {
+        "card": "[data-jk]",
+        "title": "h2.jobTitle",
+        "company": "[data-testid='company-name']",
+        "location": "[data-testid='job-location']",
+        "description": ".job-snippet",
+        "link": "h2.jobTitle a",
+    }
+    LINKEDIN_SELECTORS = {
+        "card": ".job-search-card",
+        "title": ".base-search-card__title, .job-search-card__title",
+        "company": ".base-search-card__subtitle, .job-search-card__subtitle",
+        "location": ".job-search-card__location",
+        # The public results page puts the posting link on a full-card overlay anchor
+        "link": "a.base-card__full-link, a.job-search-card__title, a[href*='/jobs/view/']",
+    }
+    GLASSDOOR_SELECTORS = {
+        "card": ".react-job-listing",
+        "title": "[data-test='job-link']",
+        "company": "[data-test='employer-name']",
+        "location": "[data-test='location']",
+        "link": "[data-test='job-link']",
+    }
+    # Only Indeed sits behind a challenge that needs a real browser; LinkedIn's guest
+    # API and Glassdoor's results page are parsed over plain HTTP only
+    INDEED_CARDS_JS = _cards_script(INDEED_SELECTORS)
+    
+    # Fixed Glassdoor search filters; only the keyword varies
+    GLASSDOOR_PARAMS = {
+        "locT": "N", "locId": "1", "jobType": "", "fromAge": "-1", "minSalary": "0",
+        "includeUnknownSalary": "false", "radius": "100", "cityId": "-1", "minRating": "0.0",
+        "industryId": "-1", "sgocId": "-1", "seniorityType": "all", "companyId": "-1",
+        "employerSizes": "0", "applicationType": "0", "remoteWorkType": "0",
+    }
+    
     def __init__(self):
         self.session = None
-        self.driver = None
-        self.setup_driver()
+        
+        # Caps concurrent requests to any one job board while different hosts proceed in parallel
+        self._host_sems: Dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(8))
+        
+        # Paces requests to each host below the rate that earns 429s, retries included
+        self._host_limiters: Dict[str, AsyncLimiter] = defaultdict(
+            lambda: AsyncLimiter(settings.SCRAPING_MAX_RPM, 60)
+        )
+        
+        # Postings already applied to by earlier runs are skipped before any further work
+        try:
+            self._seen = SeenJobStore(settings.SEEN_JOBS_DB, settings.SEEN_JOBS_TTL_DAYS)
+        except Exception as e:
+            logger.warning(f"Seen-jobs store unavailable, previously seen jobs won't be skipped: {e}")
+            self._seen = None
     
-    def setup_driver(self):
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Shared HTTP session, created on first use inside the running event loop"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=256, limit_per_host=64),
+                timeout=aiohttp.ClientTimeout(total=15, connect=5),
+                headers={"User-Agent": settings.USER_AGENT}
+            )
+        return self.session
+    
+    async def aclose(self):
+        """Close the HTTP session"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        if self._seen is not None:
+            self._seen.close()
+    
+    async def __aenter__(self) -> "JobScraper":
+        """Open the HTTP session up front so the first scrape doesn't pay for it"""
+        self._get_session()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        """Close the session and seen-jobs store and stop the browser workers"""
+        await self.aclose()
+        # Browser workers are shared by the process and restart on the next fallback if needed
+        await asyncio.to_thread(self._shutdown_browsers)
+    
+    @classmethod
+    def setup_driver(cls):
         """Setup Selenium WebDriver for dynamic content scraping"""
         try:
             chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
+            for argument in _CHROME_ARGS:
+                chrome_options.add_argument(argument)
             chrome_options.add_argument(f"--user-agent={settings.USER_AGENT}")
             
             # Use the new Service class and correct WebDriver initialization
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            service = Service(_driver_path())
+            cls._driver = webdriver.Chrome(service=service, options=chrome_options)
             
         except Exception as e:
             logger.error(f"Failed to setup WebDriver: {e}")
-            self.driver = None
+            cls._driver = None
+    
+    @classmethod
+    def _driver_alive(cls) -> bool:
+        """Whether this process's browser session still answers commands"""
+        if cls._driver is None:
+            return False
+        try:
+            cls._driver.current_url
+            return True
+        except WebDriverException:
+            return False
+    
+    @classmethod
+    def _get_driver(cls):
+        """Return this process's browser, relaunching it only if the session was lost (blocking)"""
+        if not cls._driver_alive():
+            cls._quit_driver()
+            cls.setup_driver()
+        return cls._driver
+    
+    @classmethod
+    def _quit_driver(cls):
+        """Shut down this process's browser"""
+        if cls._driver is not None:
+            try:
+                cls._driver.quit()
+            except Exception:
+                pass
+            cls._driver = None
     
-    async def scrape_jobs(self, keywords: List[str], location: str, max_jobs: int = 10) -> List[JobPosting]:
+    @classmethod
+    def _reset_browser_state(cls):
+        """Clear cookies so one scrape's session doesn't leak into the next"""
+        try:
+            cls._driver.delete_all_cookies()
+        except WebDriverException as e:
+            logger.warning(f"Failed to clear browser cookies: {e}")
+    
+    @classmethod
+    def _get_browser_pool(cls, driver_path: Optional[str]) -> ProcessPoolExecutor:
+        """Process pool for browser work, started on first fallback"""
+        if cls._browser_pool is None:
+            # spawn, since forking a process with a running event loop and threads is unsafe
+            cls._browser_pool = ProcessPoolExecutor(
+                max_workers=_BROWSER_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_browser_worker,
+                initargs=(driver_path,)
+            )
+        return cls._browser_pool
+    
+    @classmethod
+    def _shutdown_browsers(cls):
+        """Stop the browser worker processes, which quit their browsers on exit"""
+        if cls._browser_pool is not None:
+            cls._browser_pool.shutdown(wait=True, cancel_futures=True)
+            cls._browser_pool = None
+    
+    async def _run_browser(self, fn, *args):
+        """Run a browser job on the process pool without blocking the event loop"""
+        driver_path = None
+        if self._browser_pool is None:
+            # Resolved once per process and handed to every worker the pool spawns
+            try:
+                driver_path = await asyncio.wrap_future(_start_driver_lookup())
+            except Exception as e:
+                # Workers retry the lookup themselves
+                logger.warning(f"Chromedriver install failed: {e}")
+        
+        return await asyncio.get_running_loop().run_in_executor(self._get_browser_pool(driver_path), fn, *args)
+    
+    async def scrape_jobs(self, keywords: List[str], location: str, max_jobs: int = 10) -> AsyncIterator[JobPosting]:
         """
-        Scrape jobs from multiple sources based on keywords and location
+        Scrape jobs from multiple sources based on keywords and location, yielding each
+        site's postings as soon as that site finishes
         """
-        jobs = []
+        per_site = max_jobs // len(settings.SUPPORTED_JOB_SITES)
         
-        # Scrape from different job sites
-        for site in settings.SUPPORTED_JOB_SITES:
-            try:
-                site_jobs = await self._scrape_site(site, keywords, location, max_jobs // len(settings.SUPPORTED_JOB_SITES))
-                jobs.extend(site_jobs)
+        # Sites are independent hosts, so fetch them all at once
+        tasks = [
+            asyncio.create_task(self._scrape_site(site, keywords, location, per_site))
+            for site in settings.SUPPORTED_JOB_SITES
+        ]
+        
+        # Boards cross-post the same openings; a posting already yielded from another
+        # board is dropped before it costs LLM calls
+        signatures = set()
+        count = 0
+        
+        try:
+            for next_site in asyncio.as_completed(tasks):
+                try:
+                    site_jobs = await next_site
+                except Exception as e:
+                    logger.error(f"Error scraping jobs: {e}")
+                    continue
                 
-                if len(jobs) >= max_jobs:
-                    break
-                    
-                # Add delay between sites
-                await asyncio.sleep(settings.SCRAPING_DELAY)
+                fresh = []
+                for job in _dedupe_jobs(site_jobs):
+                    signature = _job_signature(job)
+                    if signature not in signatures:
+                        signatures.add(signature)
+                        fresh.append(job)
+                fresh = fresh[:max_jobs - count]
                 
-            except Exception as e:
-                logger.error(f"Error scraping {site}: {e}")
-                continue
-        
-        return jobs[:max_jobs]
+                for job in fresh:
+                    yield job
+                
+                count += len(fresh)
+                if count >= max_jobs:
+                    return
+        finally:
+            # Stopping early (or the consumer breaking out) leaves slower sites unneeded
+            for task in tasks:
+                task.cancel()
     
     async def _scrape_site(self, site: str, keywords: List[str], location: str, max_jobs: int) -> List[JobPosting]:
         """Scrape jobs from a specific site"""
@@ -83,209 +469,237 @@ class JobScraper:
     
     async def _scrape_indeed(self, keywords: List[str], location: str, max_jobs: int) -> List[JobPosting]:
         """Scrape jobs from Indeed"""
+        # Construct Indeed search URL
+        search_url = "https://www.indeed.com/jobs?" + urlencode({"q": " ".join(keywords), "l": location})
+        
+        return await self._scrape_search_page(
+            "Indeed", search_url, "https://www.indeed.com",
+            self.INDEED_SELECTORS, self.INDEED_CARDS_JS, max_jobs
+        )
+    
+    async def _fetch_html(self, url: str) -> Optional[str]:
+        """
+        Fetch a page over plain HTTP, returning None when the site blocks the request or serves
+        a challenge and an empty string for error statuses and responses that aren't an HTML
+        page of reasonable size
+        """
+        host = urlparse(url).netloc
+        
+        async with self._host_sems[host]:
+            # Transport failures and 429s are retried with backoff; bot refusals go to the
+            # caller's fallback
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(settings.MAX_RETRIES),
+                wait=_fetch_wait,
+                retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
+                reraise=True
+            ):
+                with attempt:
+                    async with self._host_limiters[host], self._get_session().get(url) as response:
+                        if response.status == 429:
+                            logger.info(f"{host} is rate limiting, backing off")
+                            response.raise_for_status()
+                        if response.status in _BLOCKED_STATUSES:
+                            logger.info(f"{host} refused the request with HTTP {response.status}")
+                            return None
+                        if response.status != 200:
+                            logger.info(f"{host} returned HTTP {response.status}")
+                            return ""
+                        if response.content_type not in _HTML_CONTENT_TYPES:
+                            logger.info(f"Skipping {response.content_type} response from {host}")
+                            return ""
+                        if (response.content_length or 0) > _MAX_PAGE_BYTES:
+                            logger.info(f"Skipping {response.content_length}-byte page from {host}")
+                            return ""
+                        
+                        # Content-Length may be missing or wrong, so the cap is enforced while reading
+                        body = bytearray()
+                        async for chunk in response.content.iter_chunked(64 * 1024):
+                            body += chunk
+                            if len(body) > _MAX_PAGE_BYTES:
+                                logger.info(f"Page from {host} exceeded {_MAX_PAGE_BYTES} bytes, skipping")
+                                return ""
+                        html = body.decode(response.charset or "utf-8", errors="replace")
+        
+        return None if _looks_blocked(html) else html
+    
+    async def _scrape_search_page(self, site_name: str, search_url: str, base_url: str,
+                                  selectors: Dict[str, str], card_script: Optional[str], max_jobs: int) -> List[JobPosting]:
+        """Scrape a search results page over HTTP, falling back to Selenium on anti-bot pages when card_script is given"""
         jobs = []
-        keyword_str = " ".join(keywords)
         
         try:
-            # Construct Indeed search URL
-            search_url = f"https://www.indeed.com/jobs?q={keyword_str.replace(' ', '+')}&l={location.replace(' ', '+')}"
+            html = await self._fetch_html(search_url)
             
-            if self.driver:
-                self.driver.get(search_url)
-                await asyncio.sleep(3)  # Wait for page to load
-                
-                # Find job cards
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, "[data-jk]")
-                
-                for card in job_cards[:max_jobs]:
-                    try:
-                        job_data = self._extract_indeed_job_data(card)
-                        if job_data:
-                            jobs.append(JobPosting(**job_data))
-                    except Exception as e:
-                        logger.error(f"Error extracting job data from Indeed: {e}")
-                        continue
-                        
+            if html is not None:
+                cards = HTMLParser(html).css(selectors["card"])[:max_jobs]
+                job_datas = [_parse_card(card, selectors, base_url) for card in cards]
+            elif card_script is None:
+                logger.info(f"{site_name} blocked plain HTTP, skipping")
+                job_datas = []
+            else:
+                logger.info(f"{site_name} blocked plain HTTP, falling back to Selenium")
+                job_datas = await self._run_browser(
+                    _browse_cards_job, search_url, selectors["card"], card_script, max_jobs
+                )
+            
+            job_datas = self._drop_seen([job_data for job_data in job_datas if job_data])
+            
+            # _job_data already emits every field with its final type, so validation
+            # would only re-check what the extractor guarantees
+            jobs = [JobPosting.model_construct(**job_data) for job_data in job_datas]
+                    
         except Exception as e:
-            logger.error(f"Error scraping Indeed: {e}")
+            logger.error(f"Error scraping {site_name}: {e}")
         
         return jobs
     
-    def _extract_indeed_job_data(self, card) -> Dict[str, Any]:
-        """Extract job data from Indeed job card"""
+    def mark_seen(self, jobs: List[JobPosting]):
+        """Record postings as processed so later scrapes skip them"""
+        if self._seen is None or not jobs:
+            return
+        
         try:
-            title = card.find_element(By.CSS_SELECTOR, "h2.jobTitle").text
-            company = card.find_element(By.CSS_SELECTOR, "[data-testid='company-name']").text
-            location = card.find_element(By.CSS_SELECTOR, "[data-testid='job-location']").text
-            
-            # Get job URL
-            job_link = card.find_element(By.CSS_SELECTOR, "h2.jobTitle a")
-            job_url = job_link.get_attribute("href")
-            
-            # Get job description (basic)
-            description = card.find_element(By.CSS_SELECTOR, ".job-snippet").text
-            
-            return {
-                "title": title,
-                "company": company,
-                "location": location,
-                "description": description,
-                "job_url": job_url,
-                "requirements": [],
-                "salary_range": None,
-                "hiring_manager_email": None,
-                "application_deadline": None,
-                "job_type": None,
-                "remote_option": None
-            }
+            self._seen.mark(job_hash(job.title, job.company, job.job_url) for job in jobs)
         except Exception as e:
-            logger.error(f"Error extracting Indeed job data: {e}")
-            return None
+            logger.warning(f"Failed to record seen jobs: {e}")
     
-    async def _scrape_linkedin(self, keywords: List[str], location: str, max_jobs: int) -> List[JobPosting]:
-        """Scrape jobs from LinkedIn"""
-        jobs = []
-        keyword_str = " ".join(keywords)
+    def _drop_seen(self, job_datas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Filter out cards already processed by an earlier run"""
+        if self._seen is None or not job_datas:
+            return job_datas
         
         try:
-            # Construct LinkedIn search URL
-            search_url = f"https://www.linkedin.com/jobs/search/?keywords={keyword_str.replace(' ', '%20')}&location={location.replace(' ', '%20')}"
-            
-            if self.driver:
-                self.driver.get(search_url)
-                await asyncio.sleep(3)
-                
-                # Find job cards
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".job-search-card")
-                
-                for card in job_cards[:max_jobs]:
-                    try:
-                        job_data = self._extract_linkedin_job_data(card)
-                        if job_data:
-                            jobs.append(JobPosting(**job_data))
-                    except Exception as e:
-                        logger.error(f"Error extracting job data from LinkedIn: {e}")
-                        continue
-                        
+            hashes = [job_hash(d["title"], d["company"], d["job_url"]) for d in job_datas]
+            unseen = self._seen.unseen(hashes)
         except Exception as e:
-            logger.error(f"Error scraping LinkedIn: {e}")
+            logger.warning(f"Seen-jobs lookup failed: {e}")
+            return job_datas
         
-        return jobs
+        return [d for d, h in zip(job_datas, hashes) if h in unseen]
     
-    def _extract_linkedin_job_data(self, card) -> Dict[str, Any]:
-        """Extract job data from LinkedIn job card"""
+    @classmethod
+    def _browse_cards(cls, url: str, card_selector: str, card_script: str, max_jobs: int) -> List[Dict[str, Any]]:
+        """Load a page in the browser and extract its job cards; blocking, runs in a browser worker"""
         try:
-            title = card.find_element(By.CSS_SELECTOR, ".job-search-card__title").text
-            company = card.find_element(By.CSS_SELECTOR, ".job-search-card__subtitle").text
-            location = card.find_element(By.CSS_SELECTOR, ".job-search-card__location").text
+            cls._driver.get(url)
             
-            # Get job URL
-            job_link = card.find_element(By.CSS_SELECTOR, ".job-search-card__title")
-            job_url = job_link.get_attribute("href")
+            # Wait only until the first card renders, bounded for pages that never show one
+            try:
+                WebDriverWait(cls._driver, _PAGE_WAIT_SECONDS).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, card_selector))
+                )
+            except TimeoutException:
+                logger.info(f"No job cards appeared on {urlparse(url).netloc} within {_PAGE_WAIT_SECONDS}s")
+                return []
             
-            return {
-                "title": title,
-                "company": company,
-                "location": location,
-                "description": "",  # Would need to visit individual job page
-                "job_url": job_url,
-                "requirements": [],
-                "salary_range": None,
-                "hiring_manager_email": None,
-                "application_deadline": None,
-                "job_type": None,
-                "remote_option": None
-            }
-        except Exception as e:
-            logger.error(f"Error extracting LinkedIn job data: {e}")
-            return None
+            # Every field of every card comes back from one script call instead of
+            # one chromedriver round-trip per find_element
+            cards = cls._driver.execute_script(card_script) or []
+            return [_job_data(fields) for fields in cards[:max_jobs]]
+        finally:
+            cls._reset_browser_state()
+    
+    async def _scrape_linkedin(self, keywords: List[str], location: str, max_jobs: int) -> List[JobPosting]:
+        """Scrape jobs from LinkedIn"""
+        # The guest API serves the same result cards as an HTML fragment, no browser needed
+        search_url = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?" + urlencode(
+            {"keywords": " ".join(keywords), "location": location, "start": 0}, quote_via=quote
+        )
+        
+        return await self._scrape_search_page(
+            "LinkedIn", search_url, "https://www.linkedin.com",
+            self.LINKEDIN_SELECTORS, None, max_jobs
+        )
     
     async def _scrape_glassdoor(self, keywords: List[str], location: str, max_jobs: int) -> List[JobPosting]:
         """Scrape jobs from Glassdoor"""
-        jobs = []
-        keyword_str = " ".join(keywords)
+        # Construct Glassdoor search URL
+        search_url = "https://www.glassdoor.com/Job/jobs.htm?" + urlencode(
+            {"sc.keyword": " ".join(keywords), **self.GLASSDOOR_PARAMS}
+        )
         
+        return await self._scrape_search_page(
+            "Glassdoor", search_url, "https://www.glassdoor.com",
+            self.GLASSDOOR_SELECTORS, None, max_jobs
+        )
+    
+    async def get_job_details(self, job_url: str) -> Dict[str, Any]:
+        """Get detailed job information from a specific job URL"""
         try:
-            # Construct Glassdoor search URL
-            search_url = f"https://www.glassdoor.com/Job/jobs.htm?sc.keyword={keyword_str.replace(' ', '+')}&locT=N&locId=1&jobType=&fromAge=-1&minSalary=0&includeUnknownSalary=false&radius=100&cityId=-1&minRating=0.0&industryId=-1&sgocId=-1&seniorityType=all&companyId=-1&employerSizes=0&applicationType=0&remoteWorkType=0"
+            html = await self._fetch_html(job_url)
             
-            if self.driver:
-                self.driver.get(search_url)
-                await asyncio.sleep(3)
-                
-                # Find job cards
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".react-job-listing")
+            # Not a usable job page; a browser wouldn't do better
+            if html == "":
+                return {}
+            
+            if html is not None:
+                return _parse_details(HTMLParser(html))
+            
+            if not _browser_allowed(job_url):
+                logger.info(f"{urlparse(job_url).netloc} blocked plain HTTP, skipping job details")
+                return {}
+            
+            return await self._run_browser(_browse_details_job, job_url)
                 
-                for card in job_cards[:max_jobs]:
-                    try:
-                        job_data = self._extract_glassdoor_job_data(card)
-                        if job_data:
-                            jobs.append(JobPosting(**job_data))
-                    except Exception as e:
-                        logger.error(f"Error extracting job data from Glassdoor: {e}")
-                        continue
-                        
         except Exception as e:
-            logger.error(f"Error scraping Glassdoor: {e}")
-        
-        return jobs
+            logger.error(f"Error getting job details: {e}")
+            return {}
+    
+    async def get_many_job_details(self, job_urls: List[str]) -> List[Dict[str, Any]]:
+        """Get details for many jobs concurrently, bounded per host"""
+        return await asyncio.gather(*(self.get_job_details(url) for url in job_urls))
     
-    def _extract_glassdoor_job_data(self, card) -> Dict[str, Any]:
-        """Extract job data from Glassdoor job card"""
+    @classmethod
+    def _browse_details(cls, job_url: str) -> Dict[str, Any]:
+        """Load a job page in the browser and extract its details; blocking, runs in a browser worker"""
         try:
-            title = card.find_element(By.CSS_SELECTOR, "[data-test='job-link']").text
-            company = card.find_element(By.CSS_SELECTOR, "[data-test='employer-name']").text
-            location = card.find_element(By.CSS_SELECTOR, "[data-test='location']").text
+            cls._driver.get(job_url)
             
-            # Get job URL
-            job_link = card.find_element(By.CSS_SELECTOR, "[data-test='job-link']")
-            job_url = job_link.get_attribute("href")
+            try:
+                WebDriverWait(cls._driver, _PAGE_WAIT_SECONDS).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ".job-description"))
+                )
+            except TimeoutException:
+                return {}
+            
+            # Extract detailed information
+            description = cls._driver.find_element(By.CSS_SELECTOR, ".job-description").text
+            
+            # Try to find requirements
+            requirements = []
+            try:
+                req_elements = cls._driver.find_elements(By.CSS_SELECTOR, ".job-requirements li")
+                requirements = [elem.text for elem in req_elements]
+            except:
+                pass
             
             return {
-                "title": title,
-                "company": company,
-                "location": location,
-                "description": "",  # Would need to visit individual job page
-                "job_url": job_url,
-                "requirements": [],
-                "salary_range": None,
-                "hiring_manager_email": None,
-                "application_deadline": None,
-                "job_type": None,
-                "remote_option": None
+                "description": description,
+                "requirements": requirements
             }
-        except Exception as e:
-            logger.error(f"Error extracting Glassdoor job data: {e}")
-            return None
-    
-    async def get_job_details(self, job_url: str) -> Dict[str, Any]:
-        """Get detailed job information from a specific job URL"""
-        try:
-            if self.driver:
-                self.driver.get(job_url)
-                await asyncio.sleep(3)
-                
-                # Extract detailed information
-                description = self.driver.find_element(By.CSS_SELECTOR, ".job-description").text
-                
-                # Try to find requirements
-                requirements = []
-                try:
-                    req_elements = self.driver.find_elements(By.CSS_SELECTOR, ".job-requirements li")
-                    requirements = [elem.text for elem in req_elements]
-                except:
-                    pass
-                
-                return {
-                    "description": description,
-                    "requirements": requirements
-                }
-                
-        except Exception as e:
-            logger.error(f"Error getting job details: {e}")
-            return {}
+        finally:
+            cls._reset_browser_state()
+
+def _init_browser_worker(driver_path: Optional[str]):
+    """Browser worker initializer: adopt the parent's chromedriver path and quit this worker's browser on exit"""
+    global _DRIVER_PATH
+    _DRIVER_PATH = driver_path
     
-    def __del__(self):
-        """Cleanup resources"""
-        if self.driver:
-            self.driver.quit() 
\ No newline at end of file
+    # Pool workers leave through multiprocessing's exit path, which skips atexit
+    Finalize(None, JobScraper._quit_driver, exitpriority=10)
+
+def _browse_cards_job(url: str, card_selector: str, card_script: str, max_jobs: int) -> List[Dict[str, Any]]:
+    """Browser worker entry point: scrape a search page with this worker's browser"""
+    if JobScraper._get_driver() is None:
+        return []
+    return JobScraper._browse_cards(url, card_selector, card_script, max_jobs)
+
+def _browse_details_job(job_url: str) -> Dict[str, Any]:
+    """Browser worker entry point: read a job page with this worker's browser"""
+    if JobScraper._get_driver() is None:
+        return {}
+    return JobScraper._browse_details(job_url)
+
+# Stop the browser workers at interpreter exit rather than racing garbage collection
+atexit.register(JobScraper._shutdown_browsers)
\ No newline at end of file
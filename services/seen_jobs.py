@@ -0,0 +1,52 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from typing import Iterable, List, Set
+
+logger = logging.getLogger(__name__)
+
+def job_hash(title: str, company: str, job_url: str) -> bytes:
+    """Stable identity of a posting across runs"""
+    return hashlib.blake2b(f"{title}|{company}|{job_url}".encode(), digest_size=16).digest()
+
+class SeenJobStore:
+    """On-disk set of postings already processed, forgotten after a TTL"""
+    
+    def __init__(self, path: str, ttl_days: int):
+        self.path = os.path.expanduser(path)
+        self.ttl_seconds = ttl_days * 86400
+        
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # Built in a startup thread but queried from the event loop
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS seen (hash BLOB PRIMARY KEY, ts INTEGER)")
+        self._conn.execute("DELETE FROM seen WHERE ts < ?", (self._cutoff(),))
+        self._conn.commit()
+    
+    def _cutoff(self) -> int:
+        """Oldest timestamp that still counts as seen"""
+        return int(time.time()) - self.ttl_seconds
+    
+    def unseen(self, hashes: List[bytes]) -> Set[bytes]:
+        """The subset of hashes not recorded within the TTL"""
+        if not hashes:
+            return set()
+        
+        placeholders = ",".join("?" * len(hashes))
+        rows = self._conn.execute(
+            f"SELECT hash FROM seen WHERE ts >= ? AND hash IN ({placeholders})",
+            (self._cutoff(), *hashes)
+        )
+        return set(hashes) - {row[0] for row in rows}
+    
+    def mark(self, hashes: Iterable[bytes]):
+        """Record hashes as seen now"""
+        now = int(time.time())
+        self._conn.executemany("INSERT OR REPLACE INTO seen (hash, ts) VALUES (?, ?)", [(h, now) for h in hashes])
+        self._conn.commit()
+    
+    def close(self):
+        """Close the database"""
+        self._conn.close()
\ No newline at end of file
@@ -0,0 +1,45 @@
+import logging
+from contextlib import AsyncExitStack
+from typing import Dict, Any, List
+
+from arq.connections import RedisSettings
+
+from models.schemas import UserProfile
+from services.crew_manager import CrewManager
+from services.http_client import SHARED_HTTPX
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+async def startup(ctx: Dict[str, Any]):
+    """Build the worker's crew manager once per worker process"""
+    logger.info("Starting pipeline worker...")
+    ctx["crew_manager"] = crew_manager = CrewManager()
+    
+    ctx["exit_stack"] = exit_stack = AsyncExitStack()
+    await exit_stack.enter_async_context(crew_manager.job_scraper)
+
+async def shutdown(ctx: Dict[str, Any]):
+    """Release the worker's pooled connections and browsers"""
+    await ctx["exit_stack"].aclose()
+    await ctx["crew_manager"].email_sender.aclose()
+    await SHARED_HTTPX.aclose()
+
+async def pipeline_job(ctx: Dict[str, Any], keywords: List[str], location: str,
+                       user_profile: Dict[str, Any], max_jobs: int) -> Dict[str, Any]:
+    """
+    Run a complete job application pipeline queued by the API
+    """
+    return await ctx["crew_manager"].create_application_pipeline(
+        keywords,
+        location,
+        UserProfile(**user_profile),
+        max_jobs
+    )
+
+class WorkerSettings:
+    """arq worker configuration, run with `arq services.tasks.WorkerSettings`"""
+    functions = [pipeline_job]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(settings.REDIS_URL)
@@ -0,0 +1,56 @@
+import asyncio
+import dataclasses
+
+import services.email_generator as email_generator_module
+from services.email_generator import EmailGenerator
+
+def _generator(monkeypatch) -> EmailGenerator:
+    """Generator whose Groq call is a slow stub counting how often it is sent"""
+    monkeypatch.setattr(email_generator_module, "settings", dataclasses.replace(
+        email_generator_module.settings, GROQ_API_KEY="test-key"
+    ))
+    generator = EmailGenerator()
+    generator.requests_sent = 0
+    
+    async def request(system_prompt, prompt, params):
+        generator.requests_sent += 1
+        await asyncio.sleep(0.05)
+        return "Subject: Hi\n\nBody"
+    
+    generator._request = request
+    return generator
+
+def test_coalesced_waiters_survive_owner_cancellation(monkeypatch):
+    generator = _generator(monkeypatch)
+    
+    async def run():
+        owner = asyncio.create_task(generator._complete("system", "prompt"))
+        await asyncio.sleep(0.01)
+        waiters = [asyncio.create_task(generator._complete("system", "prompt")) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        owner.cancel()
+        return await asyncio.gather(owner, *waiters, return_exceptions=True)
+    
+    owner_result, *waiter_results = asyncio.run(run())
+    
+    assert isinstance(owner_result, asyncio.CancelledError)
+    assert waiter_results == ["Subject: Hi\n\nBody"] * 2
+    # One waiter takes over the request and the other shares it
+    assert generator.requests_sent == 2
+
+def test_cancelled_waiter_leaves_request_running(monkeypatch):
+    generator = _generator(monkeypatch)
+    
+    async def run():
+        owner = asyncio.create_task(generator._complete("system", "prompt"))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(generator._complete("system", "prompt"))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        return await asyncio.gather(owner, waiter, return_exceptions=True)
+    
+    owner_result, waiter_result = asyncio.run(run())
+    
+    assert owner_result == "Subject: Hi\n\nBody"
+    assert isinstance(waiter_result, asyncio.CancelledError)
+    assert generator.requests_sent == 1
\ No newline at end of file
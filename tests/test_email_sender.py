@@ -0,0 +1,26 @@
+import base64
+import os
+
+from services import email_sender
+from services.email_sender import _encode_attachment
+
+def _encode(path) -> str:
+    st = os.stat(path)
+    return _encode_attachment(str(path), st.st_mtime_ns, st.st_size)
+
+def test_attachment_reencoded_after_file_changes(tmp_path):
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(b"first")
+    assert base64.b64decode(_encode(path)) == b"first"
+    
+    path.write_bytes(b"second version")
+    assert base64.b64decode(_encode(path)) == b"second version"
+
+def test_attachment_cache_bounded_by_bytes(tmp_path):
+    path = tmp_path / "portfolio.pdf"
+    path.write_bytes(os.urandom(email_sender._ATTACHMENT_CACHE_BYTES))
+    
+    encoded = _encode(path)
+    
+    assert base64.b64decode(encoded) == path.read_bytes()
+    assert _encode_attachment.cache.currsize <= email_sender._ATTACHMENT_CACHE_BYTES
\ No newline at end of file
@@ -0,0 +1,132 @@
+import asyncio
+import dataclasses
+
+from aiohttp import web
+from selectolax.parser import HTMLParser
+
+import services.job_scraper as job_scraper_module
+from services.job_scraper import JobScraper, _browser_allowed, _parse_card, _parse_details
+
+def test_parse_card_keeps_spaces_around_inline_tags():
+    html = """
+    <div data-jk="1">
+        <h2 class="jobTitle"><a href="/viewjob?jk=1"><span>Senior</span> <span>Engineer</span></a></h2>
+        <span data-testid="company-name">Acme <b>Labs</b></span>
+        <div data-testid="job-location">Remote</div>
+        <div class="job-snippet">5+ years <b>Python</b> experience</div>
+    </div>
+    """
+    card = HTMLParser(html).css_first("[data-jk]")
+    
+    job = _parse_card(card, JobScraper.INDEED_SELECTORS, "https://www.indeed.com")
+    
+    assert job["title"] == "Senior Engineer"
+    assert job["company"] == "Acme Labs"
+    assert job["description"] == "5+ years Python experience"
+    assert job["job_url"] == "https://www.indeed.com/viewjob?jk=1"
+
+def test_parse_details_keeps_spaces_around_inline_tags():
+    html = """
+    <div class="job-description">Café <b>x</b></div>
+    <ul class="job-requirements"><li>Strong <i>Go</i> skills</li></ul>
+    """
+    
+    assert _parse_details(HTMLParser(html)) == {
+        "description": "Café x",
+        "requirements": ["Strong Go skills"]
+    }
+
+def test_parse_details_without_description():
+    assert _parse_details(HTMLParser("<p>Gone</p>")) == {"description": "", "requirements": []}
+
+async def _serve(handler):
+    """Start a local HTTP server answering every path with handler"""
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}"
+
+def _scraper(monkeypatch, tmp_path) -> JobScraper:
+    """Scraper with a throwaway seen-jobs store and no browser fallback"""
+    monkeypatch.setattr(job_scraper_module, "settings", dataclasses.replace(
+        job_scraper_module.settings, SEEN_JOBS_DB=str(tmp_path / "seen.db"), MAX_RETRIES=1
+    ))
+    
+    async def no_browser(self, fn, *args):
+        raise AssertionError("browser fallback should not run")
+    
+    monkeypatch.setattr(JobScraper, "_run_browser", no_browser)
+    return JobScraper()
+
+def test_browser_allowed_only_for_indeed():
+    assert _browser_allowed("https://www.indeed.com/viewjob?jk=1")
+    assert _browser_allowed("https://indeed.com/viewjob?jk=1")
+    assert not _browser_allowed("https://www.linkedin.com/jobs/view/1")
+    assert not _browser_allowed("https://notindeed.com/job")
+
+def test_job_details_for_dead_link_skip_browser(monkeypatch, tmp_path):
+    async def run():
+        async def handler(request):
+            return web.Response(status=404, text="gone", content_type="text/html")
+        
+        runner, base = await _serve(handler)
+        async with _scraper(monkeypatch, tmp_path) as scraper:
+            try:
+                assert await scraper._fetch_html(f"{base}/job/1") == ""
+                assert await scraper.get_job_details(f"{base}/job/1") == {}
+            finally:
+                await runner.cleanup()
+    
+    asyncio.run(run())
+
+def test_job_details_blocked_off_indeed_skip_browser(monkeypatch, tmp_path):
+    async def run():
+        async def handler(request):
+            return web.Response(status=403, text="denied", content_type="text/html")
+        
+        runner, base = await _serve(handler)
+        async with _scraper(monkeypatch, tmp_path) as scraper:
+            try:
+                assert await scraper._fetch_html(f"{base}/job/1") is None
+                assert await scraper.get_job_details(f"{base}/job/1") == {}
+            finally:
+                await runner.cleanup()
+    
+    asyncio.run(run())
+
+def test_fetch_html_without_charset_decodes_as_utf8(monkeypatch, tmp_path):
+    async def run():
+        async def handler(request):
+            return web.Response(body="<div class='job-description'>Café <b>x</b></div>".encode(),
+                                headers={"Content-Type": "text/html"})
+        
+        runner, base = await _serve(handler)
+        async with _scraper(monkeypatch, tmp_path) as scraper:
+            try:
+                assert await scraper.get_job_details(f"{base}/job/1") == {"description": "Café x", "requirements": []}
+            finally:
+                await runner.cleanup()
+    
+    asyncio.run(run())
+
+def test_entering_scraper_skips_driver_lookup(monkeypatch, tmp_path):
+    async def run():
+        async with _scraper(monkeypatch, tmp_path):
+            pass
+    
+    monkeypatch.setattr(job_scraper_module, "_DRIVER_PATH_FUTURE", None)
+    asyncio.run(run())
+    assert job_scraper_module._DRIVER_PATH_FUTURE is None
+
+def test_driver_lookup_uses_configured_path(monkeypatch):
+    monkeypatch.setattr(job_scraper_module, "settings", dataclasses.replace(
+        job_scraper_module.settings, CHROMEDRIVER_PATH="/opt/chromedriver"
+    ))
+    monkeypatch.setattr(job_scraper_module, "_DRIVER_PATH_FUTURE", None)
+    monkeypatch.setattr(job_scraper_module, "ChromeDriverManager", None)
+    
+    assert job_scraper_module._start_driver_lookup().result(timeout=1) == "/opt/chromedriver"
\ No newline at end of file
@@ -0,0 +1,73 @@
+import asyncio
+
+import orjson
+
+import main
+
+class _TokenGenerator:
+    """Stands in for EmailGenerator, yielding tokens with a pause between them"""
+    
+    async def generate_email_stream(self, job_posting, user_profile, email_type="cover_letter"):
+        for i in range(20):
+            await asyncio.sleep(0.01)
+            yield f"token{i} " * 10
+
+_PAYLOAD = {
+    "job_posting": {
+        "title": "Engineer", "company": "Acme", "location": "Remote",
+        "description": "Build things", "job_url": "https://example.com/job/1"
+    },
+    "user_profile": {
+        "name": "Sam", "email": "sam@example.com", "location": "Remote",
+        "experience_years": 3, "skills": ["Python"], "education": "BSc"
+    },
+    "email_type": "cover_letter"
+}
+
+async def _collect_body_messages():
+    """Drive the ASGI app directly, recording each body message as it is sent"""
+    body = orjson.dumps(_PAYLOAD)
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "POST", "scheme": "http", "path": "/api/email/stream",
+        "raw_path": b"/api/email/stream", "query_string": b"", "root_path": "",
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"accept-encoding", b"gzip, deflate"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 1234), "server": ("test", 80),
+    }
+    received = False
+    
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.sleep(3600)
+    
+    start, chunks = {}, []
+    
+    async def send(message):
+        if message["type"] == "http.response.start":
+            start.update(message)
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+    
+    await main.app(scope, receive, send)
+    return start, chunks
+
+def test_stream_email_sends_chunks_incrementally(monkeypatch):
+    monkeypatch.setattr(main, "email_generator", _TokenGenerator())
+    
+    start, chunks = asyncio.run(_collect_body_messages())
+    
+    headers = dict(start["headers"])
+    assert start["status"] == 200
+    assert headers.get(b"content-encoding") == b"identity"
+    
+    # Each token reaches the client in its own message rather than all at the end
+    non_empty = [chunk for chunk in chunks if chunk]
+    assert len(non_empty) == 20
+    assert non_empty[0] == b"token0 " * 10
\ No newline at end of file